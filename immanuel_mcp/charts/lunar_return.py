@@ -14,7 +14,7 @@ this module implements custom logic to:
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator
 
 from immanuel import charts
 from immanuel.classes.serialize import ToJSON
@@ -26,6 +26,7 @@ from scripts.compact_serializer import CompactJSONSerializer
 from ..app import mcp
 from ..lifecycle.attach import attach_lifecycle_section
 from ..utils.coordinates import parse_coordinate
+from ..utils.chart_cache import get_natal_chart
 from ..utils.subjects import create_subject
 from ..utils.errors import handle_chart_error, validate_inputs
 from ..utils.settings import build_call_settings, build_applied_settings
@@ -41,11 +42,16 @@ logger = logging.getLogger(__name__)
 # bisection converges to well under a minute of clock time.
 _SCAN_STEP_JD = 0.25
 _ONE_MINUTE_JD = 1 / 1440
+# Successive returns are a sidereal month (27.2-27.6 days) apart, so after
+# a crossing the scan can safely skip ahead this far.
+_MIN_RETURN_GAP_JD = 26.0
+# Resolved once: _moon_longitude runs for every scan/bisection probe
+_MOON = chart_const.MOON
 
 
 def _moon_longitude(jd: float) -> float:
     """Geocentric ecliptic longitude of the Moon at a Julian date."""
-    return ephemeris.get_planet(chart_const.MOON, jd)['lon']
+    return ephemeris.get_planet(_MOON, jd)['lon']
 
 
 def _signed_delta(moon_lon: float, target_lon: float) -> float:
@@ -54,31 +60,21 @@ def _signed_delta(moon_lon: float, target_lon: float) -> float:
     return diff - 360 if diff > 180 else diff
 
 
-def _find_lunar_return_jd(
-    natal_moon_longitude: float,
-    year: int,
-    month: int,
-    lat: float,
-    lon: float,
-    timezone: str = None
-) -> float:
-    """
-    Find the Julian date of the Moon's return to its natal position within
-    a given month. See find_lunar_return_date for the search semantics; the
-    month window is interpreted in the given timezone (or the zone inferred
-    from the coordinates when omitted).
-
-    Raises:
-        ValueError: If no lunar return is found in the specified month
-    """
-    target = natal_moon_longitude % 360
-
+def _month_bounds_jd(year: int, month: int, lat: float, lon: float, timezone: str = None):
+    """Julian dates of the start of a calendar month and of the next one."""
     month_start = datetime(year, month, 1)
     month_end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
 
     start_jd = date_tools.to_jd(month_start, lat=lat, lon=lon, time_zone=timezone)
     end_jd = date_tools.to_jd(month_end, lat=lat, lon=lon, time_zone=timezone)
+    return start_jd, end_jd
 
+
+def _iter_return_jds(target: float, start_jd: float, end_jd: float) -> Iterator[float]:
+    """
+    Yield, in order, every Julian date in (start_jd, end_jd] at which the
+    Moon crosses the target longitude.
+    """
     # Scan for a sign change in the signed delta. The Moon only moves
     # forward, so the delta increases through 0 at the return; jumps of
     # ~360 at the antipode are excluded by the wrap check.
@@ -99,14 +95,78 @@ def _find_lunar_return_jd(
                     hi = mid
                 else:
                     lo = mid
-            return (lo + hi) / 2
+            return_jd = (lo + hi) / 2
+            yield return_jd
+
+            probe_jd = min(return_jd + _MIN_RETURN_GAP_JD, end_jd)
+            delta = _signed_delta(_moon_longitude(probe_jd), target)
 
         if probe_jd >= end_jd:
             break
         prev_jd, prev_delta = probe_jd, delta
-        jd += _SCAN_STEP_JD
+        jd = probe_jd + _SCAN_STEP_JD
+
+
+def _find_lunar_return_jd(
+    natal_moon_longitude: float,
+    year: int,
+    month: int,
+    lat: float,
+    lon: float,
+    timezone: str = None
+) -> float:
+    """
+    Find the Julian date of the Moon's return to its natal position within
+    a given month. See find_lunar_return_date for the search semantics; the
+    month window is interpreted in the given timezone (or the zone inferred
+    from the coordinates when omitted).
+
+    Raises:
+        ValueError: If no lunar return is found in the specified month
+    """
+    start_jd, end_jd = _month_bounds_jd(year, month, lat, lon, timezone)
+    return_jd = next(_iter_return_jds(natal_moon_longitude % 360, start_jd, end_jd), None)
+    if return_jd is None:
+        raise ValueError(f"No lunar return found in {year}-{month:02d}")
+    return return_jd
+
+
+def _find_lunar_return_jds(
+    natal_moon_longitude: float,
+    year: int,
+    months: Iterable[int],
+    lat: float,
+    lon: float,
+    timezone: str = None
+) -> Dict[int, float]:
+    """
+    Batch form of _find_lunar_return_jd: the first return in each month.
+
+    Runs one continuous scan from the first month's start to the last
+    month's end instead of restarting the scan per month, so every probe
+    is shared, and resolves the coordinates' timezone once rather than for
+    every month boundary. Results agree with the per-month search to within
+    the bisection tolerance (under a minute).
+
+    Raises:
+        ValueError: If no lunar return is found in one of the months
+    """
+    timezone = timezone or date_tools.timezone_lookup(lat, lon)
+    bounds = {month: _month_bounds_jd(year, month, lat, lon, timezone) for month in sorted(set(months))}
+    if not bounds:
+        return {}
 
-    raise ValueError(f"No lunar return found in {year}-{month:02d}")
+    span_start = min(start for start, _ in bounds.values())
+    span_end = max(end for _, end in bounds.values())
+    crossings = list(_iter_return_jds(natal_moon_longitude % 360, span_start, span_end))
+
+    return_jds = {}
+    for month, (start_jd, end_jd) in bounds.items():
+        return_jd = next((jd for jd in crossings if start_jd < jd <= end_jd), None)
+        if return_jd is None:
+            raise ValueError(f"No lunar return found in {year}-{month:02d}")
+        return_jds[month] = return_jd
+    return return_jds
 
 
 def find_lunar_return_date(
@@ -220,8 +280,7 @@ def generate_lunar_return_chart(
         return_lon = parse_coordinate(return_longitude, is_latitude=False) if return_longitude else lon
 
         # Get natal Moon's position
-        natal_subject = create_subject(date_time, lat, lon, timezone)
-        natal_chart = charts.Natal(natal_subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
         natal_moon = natal_chart.objects.get(4000002)  # Moon's index
 
         if natal_moon is None:
@@ -387,8 +446,7 @@ def generate_compact_lunar_return_chart(
         return_lon = parse_coordinate(return_longitude, is_latitude=False) if return_longitude else lon
 
         # Get natal Moon's position
-        natal_subject = create_subject(date_time, lat, lon, timezone)
-        natal_chart = charts.Natal(natal_subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
         natal_moon = natal_chart.objects.get(4000002)  # Moon's index
 
         if natal_moon is None:
@@ -478,3 +536,86 @@ def generate_compact_lunar_return_chart(
     except Exception as e:
         logger.error(f"Error generating compact lunar return chart: {str(e)}")
         return handle_chart_error(e)
+
+
+@mcp.tool()
+def generate_annual_lunar_returns(
+    date_time: str,
+    latitude: str,
+    longitude: str,
+    return_year: int,
+    timezone: str = None
+) -> Dict[str, Any]:
+    """
+    List the lunar return moments for every month of a year.
+
+    A lightweight planning companion to generate_lunar_return_chart: all
+    twelve return moments come from a single ephemeris sweep over the year
+    and no return charts are built. Pass a return_year/return_month pair
+    from the list to generate_lunar_return_chart for the full chart.
+
+    Args:
+        date_time: Birth date and time in ISO format (e.g., '1990-01-15 14:30:00')
+        latitude: Birth location latitude (e.g., '32n43' or '32.71')
+        longitude: Birth location longitude (e.g., '117w09' or '-117.15')
+        return_year: Year for the lunar returns (e.g., 2025)
+        timezone: Optional IANA timezone name (e.g., 'America/New_York')
+
+    Returns:
+        Natal Moon longitude plus 'lunar_returns': one
+        {'return_month', 'return_date'} entry per month, in month order
+    """
+    try:
+        logger.info(f"Generating annual lunar returns for {date_time} at {latitude}, {longitude} for {return_year}")
+
+        # Validate inputs
+        validate_inputs(date_time, latitude, longitude)
+
+        if not 1900 <= return_year <= 2100:
+            raise ValueError(f"Return year must be between 1900 and 2100. Got: {return_year}")
+
+        # Parse coordinates
+        lat = parse_coordinate(latitude, is_latitude=True)
+        lon = parse_coordinate(longitude, is_latitude=False)
+
+        # Get natal Moon's position
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone)
+        natal_moon = natal_chart.objects.get(4000002)  # Moon's index
+
+        if natal_moon is None:
+            raise ValueError("Could not calculate natal Moon position")
+
+        natal_moon_longitude = natal_moon.longitude.raw
+
+        # Resolve the zone once; every month boundary and return date uses it
+        zone = timezone or date_tools.timezone_lookup(lat, lon)
+        return_jds = _find_lunar_return_jds(
+            natal_moon_longitude,
+            return_year,
+            range(1, 13),
+            lat,
+            lon,
+            zone
+        )
+
+        lunar_returns = [
+            {
+                'return_month': month,
+                'return_date': date_tools.to_datetime(
+                    return_jd, time_zone=zone
+                ).replace(tzinfo=None).isoformat()
+            }
+            for month, return_jd in return_jds.items()
+        ]
+
+        logger.info(f"Annual lunar returns generated successfully for {return_year}")
+        return {
+            'natal_moon_longitude': natal_moon_longitude,
+            'return_year': return_year,
+            'lunar_returns': lunar_returns,
+            'status': 'success'
+        }
+
+    except Exception as e:
+        logger.error(f"Error generating annual lunar returns: {str(e)}")
+        return handle_chart_error(e)
@@ -454,19 +454,30 @@ def normalize_aspects_to_list(aspects: Union[List[Dict[str, Any]], Dict[str, Any
         Flat list of aspect dictionaries with self-aspects removed
     """
     aspect_list = []
+    filtered_count = 0
 
     if isinstance(aspects, list):
         aspect_list = aspects
+        if filter_self_aspects:
+            aspect_list = [
+                asp for asp in aspects
+                if isinstance(asp, dict) and asp.get('active') != asp.get('passive')
+            ]
+            filtered_count = len(aspects) - len(aspect_list)
     elif isinstance(aspects, dict):
         # Handle nested dict format: {from_id: {to_id: aspect_data}}.
         # The nesting keys carry the only record of direction (in an
         # aspects_to chart, from = this chart's object, to = the aspected
         # chart's object), so they are preserved as from_index/to_index.
-        # Entries are copied so the caller's nested structure is not mutated.
+        # Entries are copied so the caller's nested structure is not mutated;
+        # self-aspects are dropped here, before they are copied.
         for from_key, to_aspects in aspects.items():
             if isinstance(to_aspects, dict):
                 for to_key, aspect_data in to_aspects.items():
                     if isinstance(aspect_data, dict):
+                        if filter_self_aspects and aspect_data.get('active') == aspect_data.get('passive'):
+                            filtered_count += 1
+                            continue
                         entry = dict(aspect_data)
                         try:
                             entry['from_index'] = int(from_key)
@@ -475,16 +486,8 @@ def normalize_aspects_to_list(aspects: Union[List[Dict[str, Any]], Dict[str, Any
                             pass
                         aspect_list.append(entry)
 
-    # Filter out self-aspects if requested
-    if filter_self_aspects:
-        original_count = len(aspect_list)
-        aspect_list = [
-            asp for asp in aspect_list
-            if isinstance(asp, dict) and asp.get('active') != asp.get('passive')
-        ]
-        filtered_count = original_count - len(aspect_list)
-        if filtered_count > 0:
-            logger.debug(f"Filtered {filtered_count} self-aspects, {len(aspect_list)} aspects remaining")
+    if filtered_count > 0:
+        logger.debug(f"Filtered {filtered_count} self-aspects, {len(aspect_list)} aspects remaining")
 
     return aspect_list
 
@@ -1,5 +1,7 @@
 """Attach lifecycle event data to a chart response dictionary."""
 
+import copy
+import functools
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
@@ -10,6 +12,62 @@ from .lifecycle import detect_lifecycle_events, format_lifecycle_event_feed
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _detect_lifecycle_cached(
+    natal_chart,
+    comparison_chart,
+    birth_dt: datetime,
+    comparison_dt: datetime,
+    include_future: bool,
+    future_years: int,
+    max_future_events: int
+) -> Dict[str, Any]:
+    """
+    detect_lifecycle_events memoized per chart pair and datetimes.
+
+    Charts hash by identity, so this only hits for chart objects that are
+    themselves cached (utils.chart_cache, e.g. transit-to-natal paged
+    through its aspect tiers); see attach_lifecycle_section(cached_charts=).
+    The result is shared between calls: treat it as read-only.
+    """
+    return detect_lifecycle_events(
+        natal_chart=natal_chart,
+        transit_chart=comparison_chart,
+        birth_datetime=birth_dt,
+        transit_datetime=comparison_dt,
+        include_future=include_future,
+        future_years=future_years,
+        max_future_events=max_future_events
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _lifecycle_feed_cached(
+    natal_chart,
+    comparison_chart,
+    birth_dt: datetime,
+    comparison_dt: datetime,
+    include_future: bool,
+    future_years: int,
+    max_future_events: int
+) -> Dict[str, Any]:
+    """
+    Formatted lifecycle feed (no additional events), memoized like the
+    detection it formats. Shared between calls: treat it as read-only.
+    """
+    lifecycle_data = _detect_lifecycle_cached(
+        natal_chart, comparison_chart, birth_dt, comparison_dt,
+        include_future, future_years, max_future_events
+    )
+    return format_lifecycle_event_feed(lifecycle_data, comparison_dt)
+
+
+def clear_lifecycle_cache() -> None:
+    """Drop the memoized lifecycle data (and the charts it keeps alive)."""
+    _detect_lifecycle_cached.cache_clear()
+    _lifecycle_feed_cached.cache_clear()
+
+
 def attach_lifecycle_section(
     result: Dict[str, Any],
     natal_chart,
@@ -19,28 +77,52 @@ def attach_lifecycle_section(
     include_future: bool = True,
     future_years: int = 20,
     max_future_events: int = 10,
-    additional_events: Optional[List[Dict[str, Any]]] = None
+    additional_events: Optional[List[Dict[str, Any]]] = None,
+    cached_charts: bool = False
 ) -> None:
-    """Populate lifecycle fields on the result dictionary."""
+    """
+    Populate lifecycle fields on the result dictionary.
+
+    Pass cached_charts=True only when both charts come from
+    utils.chart_cache: detection is then memoized per chart pair (and the
+    attached data copied out of the memo). Charts built per call would
+    never hit the memo, only pin memory in it.
+    """
     try:
         birth_dt = parse_datetime_value(birth_datetime)
         comparison_dt = parse_datetime_value(comparison_datetime)
 
-        lifecycle_data = detect_lifecycle_events(
-            natal_chart=natal_chart,
-            transit_chart=comparison_chart,
-            birth_datetime=birth_dt,
-            transit_datetime=comparison_dt,
-            include_future=include_future,
-            future_years=future_years,
-            max_future_events=max_future_events
-        )
-
-        payload = format_lifecycle_event_feed(
-            lifecycle_data,
-            comparison_dt,
-            additional_events=additional_events
-        )
+        if cached_charts and not additional_events:
+            payload = _lifecycle_feed_cached(
+                natal_chart, comparison_chart, birth_dt, comparison_dt,
+                include_future, future_years, max_future_events
+            )
+        else:
+            if cached_charts:
+                lifecycle_data = _detect_lifecycle_cached(
+                    natal_chart, comparison_chart, birth_dt, comparison_dt,
+                    include_future, future_years, max_future_events
+                )
+            else:
+                lifecycle_data = detect_lifecycle_events(
+                    natal_chart=natal_chart,
+                    transit_chart=comparison_chart,
+                    birth_datetime=birth_dt,
+                    transit_datetime=comparison_dt,
+                    include_future=include_future,
+                    future_years=future_years,
+                    max_future_events=max_future_events
+                )
+            payload = format_lifecycle_event_feed(
+                lifecycle_data,
+                comparison_dt,
+                additional_events=additional_events
+            )
+
+        if cached_charts:
+            # Memoized events and summary are shared between calls; each
+            # response gets its own copy so nothing can mutate the cache.
+            payload = copy.deepcopy(payload)
 
         result["lifecycle_events"] = payload["events"]
         result["lifecycle_summary"] = payload["summary"]
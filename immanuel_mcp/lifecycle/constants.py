@@ -4,7 +4,7 @@ Lifecycle Events Configuration Constants
 All orbital periods, significance levels, keywords, and transit definitions.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 # ============================================================================
 # Orbital Periods (in years)
@@ -87,6 +87,9 @@ RETURN_SIGNIFICANCE: Dict[str, Dict[Any, str]] = {
     }
 }
 
+# Sort rank of each significance level (unknown levels sort after LOW)
+SIGNIFICANCE_ORDER: Dict[str, int] = {"CRITICAL": 0, "HIGH": 1, "MODERATE": 2, "LOW": 3}
+
 # ============================================================================
 # Return Keywords
 # ============================================================================
@@ -211,6 +214,21 @@ LIFECYCLE_STAGES: Dict[int, tuple] = {
     17: ("Elder Years", "Legacy and completion", 60, 120),
 }
 
+# Major milestones with typical ages, for the past events summary:
+# (name, event_type, typical_age)
+PAST_MILESTONES: Tuple[Tuple[str, str, int], ...] = (
+    ("First Jupiter Return", "return", 12),
+    ("First Nodal Return", "return", 18),
+    ("Second Jupiter Return", "return", 24),
+    ("Chiron Opposition", "major_transit", 25),
+    ("First Saturn Return", "return", 29),
+    ("Pluto Square", "major_transit", 36),
+    ("Neptune Square", "major_transit", 39),
+    ("Uranus Opposition", "major_transit", 41),
+    ("Chiron Return", "return", 50),
+    ("Second Saturn Return", "return", 58),
+)
+
 # ============================================================================
 # Tracked Planets for Returns
 # ============================================================================
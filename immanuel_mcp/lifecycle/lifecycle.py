@@ -12,7 +12,7 @@ import logging
 
 from .returns import (
     detect_all_returns,
-    PLANET_CONSTANTS,
+    get_chart_positions,
     calculate_signed_orb,
     determine_orb_status,
     determine_movement,
@@ -21,8 +21,10 @@ from .transits import detect_all_major_transits, calculate_aspect_orb, TRANSIT_O
 from .timeline import build_future_timeline, get_lifecycle_stage
 from .constants import (
     ORBITAL_PERIODS,
+    PAST_MILESTONES,
     RETURN_ORB_TOLERANCE,
-    RETURN_INTERPRETATIONS
+    RETURN_INTERPRETATIONS,
+    SIGNIFICANCE_ORDER
 )
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,9 @@ def _enrich_future_events_with_orbs(
         natal_chart: Immanuel natal chart object
         transit_chart: Immanuel transit chart object
     """
+    natal_positions = get_chart_positions(natal_chart)
+    transit_positions = get_chart_positions(transit_chart)
+
     for event in future_events:
         event_type = event.get("event_type")
 
@@ -65,20 +70,14 @@ def _enrich_future_events_with_orbs(
             if event_type == "return":
                 # Calculate orb for planetary return
                 planet_name = event.get("planet")
-                if planet_name not in PLANET_CONSTANTS:
-                    continue
-
-                planet_const = PLANET_CONSTANTS[planet_name]
-                natal_planet = natal_chart.objects.get(planet_const)
-                transit_planet = transit_chart.objects.get(planet_const)
 
                 # Skip if planet not accessible (e.g., nodes may not be in objects collection)
-                if natal_planet is None or transit_planet is None:
+                if planet_name not in natal_positions or planet_name not in transit_positions:
                     logger.debug(f"Skipping orb calculation for {planet_name} (not accessible in chart objects)")
                     continue
 
-                natal_pos = natal_planet.longitude.raw
-                transit_pos = transit_planet.longitude.raw
+                natal_pos, _, _ = natal_positions[planet_name]
+                transit_pos, speed, _ = transit_positions[planet_name]
 
                 orb = calculate_signed_orb(natal_pos, transit_pos)
                 tolerance = RETURN_ORB_TOLERANCE.get(planet_name, 2.0)
@@ -86,8 +85,7 @@ def _enrich_future_events_with_orbs(
                 # Angular distance (0-180°) between current and natal position
                 event["current_angular_separation"] = round(abs(orb), 2)
                 event["orb_status"] = determine_orb_status(orb, tolerance)
-                speed = getattr(transit_planet, 'speed', None)
-                if isinstance(speed, (int, float)):
+                if speed is not None:
                     event["movement"] = determine_movement(orb, speed)
 
             elif event_type == "major_transit":
@@ -99,19 +97,13 @@ def _enrich_future_events_with_orbs(
                 if not all([natal_object_name, transit_object_name, aspect_type]):
                     continue
 
-                if natal_object_name not in PLANET_CONSTANTS:
+                if natal_object_name not in natal_positions:
                     continue
-                if transit_object_name not in PLANET_CONSTANTS:
+                if transit_object_name not in transit_positions:
                     continue
 
-                natal_planet_const = PLANET_CONSTANTS[natal_object_name]
-                transit_planet_const = PLANET_CONSTANTS[transit_object_name]
-
-                natal_planet = natal_chart.objects.get(natal_planet_const)
-                transit_planet = transit_chart.objects.get(transit_planet_const)
-
-                natal_pos = natal_planet.longitude.raw
-                transit_pos = transit_planet.longitude.raw
+                natal_pos, _, _ = natal_positions[natal_object_name]
+                transit_pos, speed, _ = transit_positions[transit_object_name]
 
                 orb = calculate_aspect_orb(natal_pos, transit_pos, aspect_type)
 
@@ -120,8 +112,7 @@ def _enrich_future_events_with_orbs(
                     tolerance = TRANSIT_ORB_TOLERANCE.get(aspect_type, 3.0)
                     event["current_angular_separation"] = round(abs(orb), 2)
                     event["orb_status"] = determine_orb_status(orb, tolerance)
-                    speed = getattr(transit_planet, 'speed', None)
-                    if isinstance(speed, (int, float)):
+                    if speed is not None:
                         signed_distance = calculate_signed_orb(natal_pos, transit_pos)
                         orb_rate = speed if signed_distance >= 0 else -speed
                         event["movement"] = determine_movement(orb, orb_rate)
@@ -251,10 +242,9 @@ def detect_lifecycle_events(
         current_events.append(transit_data)
 
     # Sort combined events by significance then orb
-    significance_order = {"CRITICAL": 0, "HIGH": 1, "MODERATE": 2, "LOW": 3}
     current_events.sort(
         key=lambda e: (
-            significance_order.get(e["significance"], 4),
+            SIGNIFICANCE_ORDER.get(e["significance"], 4),
             abs(e.get("orb", 999))  # Use high value if orb not present
         )
     )
@@ -341,21 +331,7 @@ def build_past_events_summary(current_age: float) -> list[Dict[str, Any]]:
     """
     past_events = []
 
-    # Major milestones with typical ages
-    milestones = [
-        ("First Jupiter Return", "return", 12),
-        ("First Nodal Return", "return", 18),
-        ("Second Jupiter Return", "return", 24),
-        ("Chiron Opposition", "major_transit", 25),
-        ("First Saturn Return", "return", 29),
-        ("Pluto Square", "major_transit", 36),
-        ("Neptune Square", "major_transit", 39),
-        ("Uranus Opposition", "major_transit", 41),
-        ("Chiron Return", "return", 50),
-        ("Second Saturn Return", "return", 58),
-    ]
-
-    for event_name, event_type, typical_age in milestones:
+    for event_name, event_type, typical_age in PAST_MILESTONES:
         # Only include if person is past the typical age
         if current_age > typical_age + 1:  # Add 1 year buffer
             past_events.append({
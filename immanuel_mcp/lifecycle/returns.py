@@ -12,9 +12,10 @@ Key concepts:
 - Status: Whether return is exact, tight, moderate, or loose
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+import weakref
 
 from immanuel.const import chart as chart_const
 
@@ -23,6 +24,7 @@ from .constants import (
     RETURN_SIGNIFICANCE,
     RETURN_KEYWORDS,
     RETURN_ORB_TOLERANCE,
+    SIGNIFICANCE_ORDER,
     TRACKED_RETURN_PLANETS
 )
 
@@ -45,6 +47,49 @@ PLANET_CONSTANTS = {
     "South Node": chart_const.SOUTH_NODE,
 }
 
+# Per-chart position tables, dropped automatically when the chart is freed
+_position_cache: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_chart_positions(chart) -> Dict[str, Tuple[float, Optional[float], str]]:
+    """
+    Get (longitude, speed, sign name) for every PLANET_CONSTANTS body in a chart.
+
+    Returns, transits and future-timeline enrichment all probe the same
+    bodies; the table is built once per chart object and reused so each
+    body's longitude.raw/speed/sign chain is read only once. Bodies missing
+    from chart.objects are omitted; speed is None when the object has no
+    numeric speed.
+
+    Args:
+        chart: Immanuel chart object
+
+    Returns:
+        Dict mapping planet name to (longitude, speed, sign name)
+    """
+    try:
+        return _position_cache[chart]
+    except (KeyError, TypeError):
+        pass
+
+    positions = {}
+    for planet_name, planet_const in PLANET_CONSTANTS.items():
+        obj = chart.objects.get(planet_const)
+        if obj is None:
+            continue
+        speed = getattr(obj, 'speed', None)
+        positions[planet_name] = (
+            obj.longitude.raw,
+            speed if isinstance(speed, (int, float)) else None,
+            obj.sign.name
+        )
+
+    try:
+        _position_cache[chart] = positions
+    except TypeError:
+        pass  # chart type doesn't support weak references; just don't cache
+    return positions
+
 
 def calculate_signed_orb(natal_pos: float, transit_pos: float) -> float:
     """
@@ -81,6 +126,29 @@ def calculate_signed_orb(natal_pos: float, transit_pos: float) -> float:
     return diff
 
 
+def arc_distance(pos_a: float, pos_b: float) -> float:
+    """
+    Unsigned angular distance between two ecliptic positions.
+
+    A single modular expression, so wrap-around needs no branching
+    (359° and 1° are 2° apart, not 358°).
+
+    Args:
+        pos_a: Position in degrees
+        pos_b: Position in degrees
+
+    Returns:
+        Distance in degrees (0 to 180)
+
+    Examples:
+        >>> arc_distance(359.0, 1.0)
+        2.0
+        >>> arc_distance(10.0, 190.0)
+        180.0
+    """
+    return abs((pos_b - pos_a + 180.0) % 360.0 - 180.0)
+
+
 def determine_movement(signed_orb: float, orb_rate: float, exact_threshold: float = 0.5) -> str:
     """
     Determine whether an event is applying, exact, or separating.
@@ -242,19 +310,15 @@ def calculate_planetary_return(
     if planet_name not in PLANET_CONSTANTS:
         raise ValueError(f"Unknown planet: {planet_name}")
 
-    planet_const = PLANET_CONSTANTS[planet_name]
-
-    # Get planet objects from charts
-    try:
-        natal_planet = natal_chart.objects.get(planet_const)
-        transit_planet = transit_chart.objects.get(planet_const)
-    except (AttributeError, KeyError) as e:
-        logger.warning(f"Planet {planet_name} not found in chart: {e}")
+    # Look up positions from the per-chart tables
+    natal_positions = get_chart_positions(natal_chart)
+    transit_positions = get_chart_positions(transit_chart)
+    if planet_name not in natal_positions or planet_name not in transit_positions:
+        logger.warning(f"Planet {planet_name} not found in chart")
         return None
 
-    # Extract positions (longitude is an Angle object with .raw attribute)
-    natal_pos = natal_planet.longitude.raw
-    transit_pos = transit_planet.longitude.raw
+    natal_pos, _, natal_sign = natal_positions[planet_name]
+    transit_pos, speed, transit_sign = transit_positions[planet_name]
 
     # Calculate orb
     orb = calculate_signed_orb(natal_pos, transit_pos)
@@ -277,10 +341,9 @@ def calculate_planetary_return(
     # Applying/separating and estimated perfection date from the transiting
     # planet's current speed. For a return, the signed orb closes at exactly
     # the planet's own rate of motion.
-    speed = getattr(transit_planet, 'speed', None)
     movement = None
     estimated_exact = None
-    if isinstance(speed, (int, float)):
+    if speed is not None:
         movement = determine_movement(orb, speed)
         estimated_exact = estimate_exact_datetime(orb, speed, transit_datetime)
 
@@ -295,8 +358,8 @@ def calculate_planetary_return(
         "orb_status": orb_status,
         "movement": movement,
         "estimated_exact_date": estimated_exact.strftime("%Y-%m-%d") if estimated_exact else None,
-        "natal_sign": natal_planet.sign.name,
-        "transit_sign": transit_planet.sign.name,
+        "natal_sign": natal_sign,
+        "transit_sign": transit_sign,
         "significance": significance,
         "keywords": RETURN_KEYWORDS.get(planet_name, []),
         "age": round(age, 1),
@@ -354,10 +417,9 @@ def detect_all_returns(
             continue
 
     # Sort by significance (CRITICAL > HIGH > MODERATE > LOW) then by orb
-    significance_order = {"CRITICAL": 0, "HIGH": 1, "MODERATE": 2, "LOW": 3}
     active_returns.sort(
         key=lambda r: (
-            significance_order.get(r["significance"], 4),
+            SIGNIFICANCE_ORDER.get(r["significance"], 4),
             abs(r["orb"])
         )
     )
@@ -15,6 +15,7 @@ from .constants import (
     RETURN_SIGNIFICANCE,
     RETURN_KEYWORDS,
     MAJOR_LIFE_TRANSITS,
+    SIGNIFICANCE_ORDER,
     TRACKED_RETURN_PLANETS
 )
 from .returns import get_return_significance
@@ -228,11 +229,10 @@ def build_future_timeline(
             continue
 
     # Sort by years_until (soonest first), then by significance
-    significance_order = {"CRITICAL": 0, "HIGH": 1, "MODERATE": 2, "LOW": 3}
     future_events.sort(
         key=lambda e: (
             e["years_until"],
-            significance_order.get(e["significance"], 4)
+            SIGNIFICANCE_ORDER.get(e["significance"], 4)
         )
     )
 
@@ -240,6 +240,89 @@ def build_future_timeline(
     return future_events[:max_events]
 
 
+# Major lifecycle stages based on transits, searched by get_lifecycle_stage
+_LIFECYCLE_STAGES = (
+    {
+        "age_range": (0, 12),
+        "stage_name": "Childhood",
+        "description": "Foundation building and early development",
+        "themes": ("learning", "growth", "discovery")
+    },
+    {
+        "age_range": (12, 18),
+        "stage_name": "First Jupiter Return & Adolescence",
+        "description": "Expansion of identity and coming of age",
+        "themes": ("identity", "independence", "exploration")
+    },
+    {
+        "age_range": (18, 25),
+        "stage_name": "Early Adulthood",
+        "description": "Independence and self-discovery",
+        "themes": ("freedom", "experimentation", "relationships")
+    },
+    {
+        "age_range": (25, 29),
+        "stage_name": "Chiron Opposition Period",
+        "description": "First major wound healing crisis",
+        "themes": ("healing", "vulnerability", "teaching")
+    },
+    {
+        "age_range": (29, 31),
+        "stage_name": "Saturn Return",
+        "description": "Karmic maturation and life restructuring",
+        "themes": ("responsibility", "maturity", "commitment")
+    },
+    {
+        "age_range": (31, 36),
+        "stage_name": "Post-Saturn Return",
+        "description": "Building authentic path",
+        "themes": ("clarity", "purpose", "manifestation")
+    },
+    {
+        "age_range": (36, 38),
+        "stage_name": "Pluto Square",
+        "description": "Deep transformation and power recalibration",
+        "themes": ("transformation", "power", "rebirth")
+    },
+    {
+        "age_range": (38, 41),
+        "stage_name": "Neptune Square",
+        "description": "Spiritual crisis or awakening",
+        "themes": ("spirituality", "faith", "illusion")
+    },
+    {
+        "age_range": (41, 43),
+        "stage_name": "Uranus Opposition",
+        "description": "Midlife awakening and liberation",
+        "themes": ("freedom", "authenticity", "revolution")
+    },
+    {
+        "age_range": (43, 50),
+        "stage_name": "Mature Adulthood",
+        "description": "Integration of wisdom",
+        "themes": ("mastery", "teaching", "legacy")
+    },
+    {
+        "age_range": (50, 58),
+        "stage_name": "Chiron Return Period",
+        "description": "Emergence as wounded healer",
+        "themes": ("healing", "wisdom", "service")
+    },
+    {
+        "age_range": (58, 60),
+        "stage_name": "Second Saturn Return",
+        "description": "Elder wisdom and life review",
+        "themes": ("wisdom", "legacy", "completion")
+    },
+    {
+        "age_range": (60, 120),
+        "stage_name": "Elder Years",
+        "description": "Wisdom sharing and legacy building",
+        "themes": ("teaching", "legacy", "integration")
+    }
+)
+
+
 def get_lifecycle_stage(age: float) -> Dict[str, Any]:
     """
     Determine current lifecycle stage based on age.
@@ -262,97 +345,15 @@ def get_lifecycle_stage(age: float) -> Dict[str, Any]:
         >>> get_lifecycle_stage(41.2)
         {"stage_name": "Uranus Opposition", ...}
     """
-    # Define major lifecycle stages based on transits
-    stages = [
-        {
-            "age_range": (0, 12),
-            "stage_name": "Childhood",
-            "description": "Foundation building and early development",
-            "themes": ["learning", "growth", "discovery"]
-        },
-        {
-            "age_range": (12, 18),
-            "stage_name": "First Jupiter Return & Adolescence",
-            "description": "Expansion of identity and coming of age",
-            "themes": ["identity", "independence", "exploration"]
-        },
-        {
-            "age_range": (18, 25),
-            "stage_name": "Early Adulthood",
-            "description": "Independence and self-discovery",
-            "themes": ["freedom", "experimentation", "relationships"]
-        },
-        {
-            "age_range": (25, 29),
-            "stage_name": "Chiron Opposition Period",
-            "description": "First major wound healing crisis",
-            "themes": ["healing", "vulnerability", "teaching"]
-        },
-        {
-            "age_range": (29, 31),
-            "stage_name": "Saturn Return",
-            "description": "Karmic maturation and life restructuring",
-            "themes": ["responsibility", "maturity", "commitment"]
-        },
-        {
-            "age_range": (31, 36),
-            "stage_name": "Post-Saturn Return",
-            "description": "Building authentic path",
-            "themes": ["clarity", "purpose", "manifestation"]
-        },
-        {
-            "age_range": (36, 38),
-            "stage_name": "Pluto Square",
-            "description": "Deep transformation and power recalibration",
-            "themes": ["transformation", "power", "rebirth"]
-        },
-        {
-            "age_range": (38, 41),
-            "stage_name": "Neptune Square",
-            "description": "Spiritual crisis or awakening",
-            "themes": ["spirituality", "faith", "illusion"]
-        },
-        {
-            "age_range": (41, 43),
-            "stage_name": "Uranus Opposition",
-            "description": "Midlife awakening and liberation",
-            "themes": ["freedom", "authenticity", "revolution"]
-        },
-        {
-            "age_range": (43, 50),
-            "stage_name": "Mature Adulthood",
-            "description": "Integration of wisdom",
-            "themes": ["mastery", "teaching", "legacy"]
-        },
-        {
-            "age_range": (50, 58),
-            "stage_name": "Chiron Return Period",
-            "description": "Emergence as wounded healer",
-            "themes": ["healing", "wisdom", "service"]
-        },
-        {
-            "age_range": (58, 60),
-            "stage_name": "Second Saturn Return",
-            "description": "Elder wisdom and life review",
-            "themes": ["wisdom", "legacy", "completion"]
-        },
-        {
-            "age_range": (60, 120),
-            "stage_name": "Elder Years",
-            "description": "Wisdom sharing and legacy building",
-            "themes": ["teaching", "legacy", "integration"]
-        }
-    ]
-
     # Find matching stage
-    for stage in stages:
+    for stage in _LIFECYCLE_STAGES:
         min_age, max_age = stage["age_range"]
         if min_age <= age < max_age:
             return {
                 "stage_name": stage["stage_name"],
                 "description": stage["description"],
                 "age_range": [min_age, max_age],
-                "themes": stage["themes"]
+                "themes": list(stage["themes"])
             }
 
     # Default for very old age
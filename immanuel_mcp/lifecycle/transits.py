@@ -19,9 +19,11 @@ import logging
 
 from immanuel.const import chart as chart_const
 
-from .constants import MAJOR_LIFE_TRANSITS
+from .constants import MAJOR_LIFE_TRANSITS, SIGNIFICANCE_ORDER
 from .returns import (
     PLANET_CONSTANTS,
+    get_chart_positions,
+    arc_distance,
     calculate_signed_orb,
     determine_movement,
     estimate_exact_datetime,
@@ -70,14 +72,14 @@ def calculate_aspect_orb(
 
     target_angle = aspect_angles[aspect_type]
 
-    # Angular separation is |signed distance| and therefore lies in [0, 180],
+    # Angular separation is the unsigned arc and therefore lies in [0, 180],
     # so both the waxing and waning square appear as separation ~= 90 and a
     # single signed orb (separation - target) covers every case. The sign
     # convention: negative = separation still short of the aspect angle,
     # positive = past it. Whether that means applying or separating depends
     # on the transiting planet's direction of motion - see
     # check_major_transit, which derives it from the planet's speed.
-    separation = abs(calculate_signed_orb(natal_pos, transit_pos))
+    separation = arc_distance(natal_pos, transit_pos)
 
     return separation - target_angle
 
@@ -134,20 +136,15 @@ def check_major_transit(
         logger.warning(f"Unknown transit object: {transit_object_name}")
         return None
 
-    natal_planet_const = PLANET_CONSTANTS[natal_object_name]
-    transit_planet_const = PLANET_CONSTANTS[transit_object_name]
-
-    # Get planet objects
-    try:
-        natal_planet = natal_chart.objects.get(natal_planet_const)
-        transit_planet = transit_chart.objects.get(transit_planet_const)
-    except (AttributeError, KeyError) as e:
-        logger.warning(f"Planet not found in chart: {e}")
+    # Look up positions from the per-chart tables
+    natal_positions = get_chart_positions(natal_chart)
+    transit_positions = get_chart_positions(transit_chart)
+    if natal_object_name not in natal_positions or transit_object_name not in transit_positions:
+        logger.warning(f"Planet not found in chart: {natal_object_name}/{transit_object_name}")
         return None
 
-    # Extract positions (longitude is an Angle object with .raw attribute)
-    natal_pos = natal_planet.longitude.raw
-    transit_pos = transit_planet.longitude.raw
+    natal_pos, _, _ = natal_positions[natal_object_name]
+    transit_pos, speed, _ = transit_positions[transit_object_name]
 
     # Calculate aspect orb
     orb = calculate_aspect_orb(natal_pos, transit_pos, aspect_type)
@@ -178,10 +175,9 @@ def check_major_transit(
     # Applying/separating from the transiting planet's speed. The signed
     # aspect orb is (separation - target); separation = |signed distance|,
     # so its rate of change is sign(distance) * speed.
-    speed = getattr(transit_planet, 'speed', None)
     movement = None
     estimated_exact = None
-    if isinstance(speed, (int, float)):
+    if speed is not None:
         signed_distance = calculate_signed_orb(natal_pos, transit_pos)
         orb_rate = speed if signed_distance >= 0 else -speed
         movement = determine_movement(orb, orb_rate)
@@ -257,10 +253,9 @@ def detect_all_major_transits(
             continue
 
     # Sort by significance (CRITICAL > HIGH > MODERATE) then by orb
-    significance_order = {"CRITICAL": 0, "HIGH": 1, "MODERATE": 2, "LOW": 3}
     active_transits.sort(
         key=lambda t: (
-            significance_order.get(t["significance"], 4),
+            SIGNIFICANCE_ORDER.get(t["significance"], 4),
             abs(t["orb"])
         )
     )
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict, List
 from ..constants import CELESTIAL_BODIES
-from ..pagination.helpers import classify_aspect_priority, get_actual_orb
+from ..pagination.helpers import classify_orb, get_actual_orb
 
 def build_optimized_aspects(aspects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
@@ -49,12 +49,13 @@ def build_optimized_aspects(aspects: List[Dict[str, Any]]) -> List[Dict[str, Any
 
         # Build optimized aspect. 'orb' is the actual deviation from exact,
         # not the configured maximum (see get_actual_orb).
+        orb = get_actual_orb(aspect)
         optimized_aspect = {
             'planets': planets_label,
             'type': aspect.get('type'),
-            'orb': round(get_actual_orb(aspect), 2),
+            'orb': round(orb, 2),
             'movement': movement_str,
-            'priority': classify_aspect_priority(aspect)
+            'priority': classify_orb(orb)
         }
 
         # Add interpretation if present
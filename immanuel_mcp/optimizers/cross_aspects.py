@@ -17,8 +17,7 @@ from ..interpretations.aspects import (
 from ..pagination.helpers import (
     build_aspect_summary,
     classify_all_aspects,
-    classify_aspect_priority,
-    filter_aspects_by_priority,
+    classify_orb,
     get_actual_orb,
 )
 
@@ -61,13 +60,14 @@ def build_full_cross_aspects(
         to_name = object_names.get(aspect.get("to_index"))
         if not from_name or not to_name:
             continue
+        orb = get_actual_orb(aspect)
         entries.append({
             source_key: from_name,
             "natal_object": to_name,
             "type": aspect.get("type"),
-            "orb": round(get_actual_orb(aspect), 2),
+            "orb": round(orb, 2),
             "movement": _movement_label(aspect),
-            "priority": classify_aspect_priority(aspect),
+            "priority": classify_orb(orb),
         })
     return entries
 
@@ -93,14 +93,19 @@ def build_compact_cross_aspects(
     tight, moderate, loose = classify_all_aspects(all_aspects)
     summary = build_aspect_summary(tight, moderate, loose, aspect_priority)
 
+    selected = all_aspects if aspect_priority == "all" else {
+        "tight": tight, "moderate": moderate, "loose": loose
+    }[aspect_priority]
+
     entries = []
-    for aspect in filter_aspects_by_priority(all_aspects, aspect_priority):
+    for aspect in selected:
+        orb = get_actual_orb(aspect)
         entry = {
             source_key: aspect.get("from_object"),
             "natal_object": aspect.get("to_object"),
             "type": aspect.get("type"),
-            "orb": round(get_actual_orb(aspect), 2),
-            "priority": classify_aspect_priority(aspect),
+            "orb": round(orb, 2),
+            "priority": classify_orb(orb),
         }
         interp = get_context_aware_interpretation(
             aspect.get("object1", ""), aspect.get("object2", ""), aspect.get("type", "")
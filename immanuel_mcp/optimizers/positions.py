@@ -1,8 +1,14 @@
 """Position formatting and optimization"""
 
-from typing import Any, Dict, Optional
+from operator import attrgetter
+from typing import Any, Dict, Optional, Tuple
+
+from immanuel.const import chart as chart_const
+
 from ..constants import CELESTIAL_BODIES
 
+_sign_name = attrgetter('sign.name')
+
 def format_position(sign_longitude: Dict[str, Any], sign_name: str) -> str:
     """
     Create a compact position string from sign longitude and sign name.
@@ -25,6 +31,40 @@ def format_position(sign_longitude: Dict[str, Any], sign_name: str) -> str:
     return f"{formatted} {sign_name}"
 
 
+def object_sign_name(obj: Any) -> str:
+    """
+    Sign name of a chart object, or "Unknown" if the object or its sign is missing.
+
+    Args:
+        obj: Chart object (e.g. natal.objects.get(chart_const.SUN)) or None
+
+    Returns:
+        Sign name like "Capricorn"
+    """
+    try:
+        return _sign_name(obj)
+    except AttributeError:
+        return "Unknown"
+
+
+def natal_sign_names(natal_chart) -> Tuple[str, str, str]:
+    """
+    Sun, Moon and rising sign names read straight off a chart object.
+
+    Args:
+        natal_chart: Immanuel chart (not its JSON form)
+
+    Returns:
+        Tuple of (sun_sign, moon_sign, rising_sign), "Unknown" where missing
+    """
+    objects = natal_chart.objects
+    return (
+        object_sign_name(objects.get(chart_const.SUN)),
+        object_sign_name(objects.get(chart_const.MOON)),
+        object_sign_name(objects.get(chart_const.ASC))
+    )
+
+
 def format_declination(declination: Dict[str, Any]) -> str:
     """
     Create a compact declination string.
@@ -117,3 +157,46 @@ def build_optimized_transit_positions(transit_data: Dict[str, Any]) -> Dict[str,
         }
 
     return optimized
+
+
+def build_columnar_transit_positions(transit_data: Dict[str, Any]) -> Dict[str, list]:
+    """
+    Build transit positions as parallel numeric columns.
+
+    Each field name appears once instead of once per planet. Longitude
+    (0-360) and declination are raw degrees rounded to 4 places rather than
+    formatted strings, and the retrograde/out_of_bounds flags are sent as 0/1.
+
+    Args:
+        transit_data: Full transit chart data from ToJSON serializer
+
+    Returns:
+        Dict of equal-length lists: names, longitude, declination,
+        retrograde, out_of_bounds, house
+    """
+    columns = {
+        'names': [],
+        'longitude': [],
+        'declination': [],
+        'retrograde': [],
+        'out_of_bounds': [],
+        'house': []
+    }
+
+    for obj_data in transit_data.get('objects', {}).values():
+        if not isinstance(obj_data, dict):
+            continue
+
+        index = obj_data.get('index')
+        if index not in CELESTIAL_BODIES:
+            continue
+
+        declination = obj_data.get('declination', {}).get('raw')
+        columns['names'].append(CELESTIAL_BODIES[index])
+        columns['longitude'].append(round(obj_data.get('longitude', {}).get('raw', 0.0), 4))
+        columns['declination'].append(None if declination is None else round(declination, 4))
+        columns['retrograde'].append(int(bool(obj_data.get('movement', {}).get('retrograde', False))))
+        columns['out_of_bounds'].append(int(bool(obj_data.get('out_of_bounds', False))))
+        columns['house'].append(obj_data.get('house', {}).get('number'))
+
+    return columns
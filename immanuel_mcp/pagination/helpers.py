@@ -1,5 +1,8 @@
 """Pagination helpers"""
 
+import math
+from bisect import bisect_left
+
 # ============================================================================
 # Aspect Pagination Helpers (for MCP size limit compliance)
 # ============================================================================
@@ -29,6 +32,29 @@ def get_actual_orb(aspect: dict) -> float:
     return abs(aspect.get('orb') or 0)
 
 
+# Tier names in order, and the inclusive upper orb bound of all but the last
+PRIORITY_TIERS = ("tight", "moderate", "loose")
+_TIER_BOUNDS = (2.0, 5.0)
+
+
+def _tier_index(orb: float) -> int:
+    """
+    Index into PRIORITY_TIERS for an actual orb.
+
+    A bisect over the tier bounds; bisect_left keeps each bound inclusive.
+    NaN compares false against every bound, so it is sent to "loose"
+    explicitly instead of landing in "tight".
+    """
+    if math.isnan(orb):
+        return len(PRIORITY_TIERS) - 1
+    return bisect_left(_TIER_BOUNDS, orb)
+
+
+def classify_orb(orb: float) -> str:
+    """Priority tier for an actual orb (see classify_aspect_priority)."""
+    return PRIORITY_TIERS[_tier_index(orb)]
+
+
 def classify_aspect_priority(aspect: dict) -> str:
     """
     Classify aspect by actual orb (deviation from exact) into priority tiers.
@@ -44,31 +70,7 @@ def classify_aspect_priority(aspect: dict) -> str:
     Returns:
         "tight", "moderate", or "loose"
     """
-    orb = get_actual_orb(aspect)
-
-    if orb <= 2.0:
-        return "tight"
-    elif orb <= 5.0:
-        return "moderate"
-    else:
-        return "loose"
-
-
-def filter_aspects_by_priority(aspects: list, priority: str) -> list:
-    """
-    Filter aspects to only those matching the specified priority tier.
-
-    Args:
-        aspects: List of aspect dictionaries
-        priority: "tight", "moderate", "loose", or "all"
-
-    Returns:
-        Filtered list of aspects
-    """
-    if priority == "all":
-        return aspects
-
-    return [asp for asp in aspects if classify_aspect_priority(asp) == priority]
+    return classify_orb(get_actual_orb(aspect))
 
 
 def classify_all_aspects(aspects: list) -> tuple:
@@ -81,20 +83,11 @@ def classify_all_aspects(aspects: list) -> tuple:
     Returns:
         Tuple of (tight_aspects, moderate_aspects, loose_aspects)
     """
-    tight = []
-    moderate = []
-    loose = []
-
+    tiers = ([], [], [])
     for aspect in aspects:
-        priority = classify_aspect_priority(aspect)
-        if priority == "tight":
-            tight.append(aspect)
-        elif priority == "moderate":
-            moderate.append(aspect)
-        else:
-            loose.append(aspect)
-
-    return (tight, moderate, loose)
+        tiers[_tier_index(get_actual_orb(aspect))].append(aspect)
+
+    return tiers
 
 
 def build_aspect_summary(
@@ -0,0 +1,160 @@
+"""Memoized chart construction.
+
+Tool calls often rebuild the same natal chart: paging through the
+aspect_priority tiers of one transit-to-natal request, or asking for the
+full and compact variant of the same birth data. The chart object itself
+is cached (not a serialized response), so every response variant reuses
+the same computed positions, houses and aspects.
+"""
+
+import functools
+import json
+
+from immanuel import charts
+from immanuel.classes.serialize import ToJSON
+
+from ..interpretations.aspects import normalize_aspects_to_list
+from ..lifecycle.attach import clear_lifecycle_cache
+from ..pagination.helpers import classify_all_aspects
+from .settings import build_call_settings
+from .subjects import create_subject
+
+
+@functools.lru_cache(maxsize=128)
+def get_natal_chart(
+    date_time,
+    latitude: float,
+    longitude: float,
+    timezone: str = None,
+    house_system: str = None
+) -> charts.Natal:
+    """
+    Build (or reuse) the natal chart for a birth moment and place.
+
+    Keyed on the exact arguments, so pass parsed coordinates. Charts are
+    shared between calls and must be treated as read-only; building
+    another chart with aspects_to=<cached chart> does not modify it.
+
+    Charts built without house_system use the session-global settings:
+    call clear_chart_cache() whenever those change.
+
+    Args:
+        date_time: Birth date and time (ISO string or datetime)
+        latitude: Parsed latitude as float
+        longitude: Parsed longitude as float
+        timezone: Optional IANA timezone name
+        house_system: Optional per-call house system name
+
+    Returns:
+        immanuel Natal chart
+    """
+    subject = create_subject(date_time, latitude, longitude, timezone)
+    return charts.Natal(subject, settings=build_call_settings(house_system))
+
+
+@functools.lru_cache(maxsize=32)
+def get_transit_to_natal_charts(
+    natal_key: tuple,
+    transit_key: tuple,
+    timezone: str = None,
+    house_system: str = None
+) -> tuple:
+    """
+    Build (or reuse) a natal chart and the transit chart aspecting it.
+
+    Shared by the full and compact transit-to-natal tools, which differ
+    only in how they serialize the pair. Charts are shared between calls:
+    treat them as read-only.
+
+    Args:
+        natal_key: (date_time, latitude, longitude) of the birth
+        transit_key: (date_time, latitude, longitude) of the transits
+        timezone: Optional IANA timezone name, applied to both datetimes
+        house_system: Optional per-call house system name
+
+    Returns:
+        Tuple of (natal_chart, transit_chart)
+    """
+    natal_chart = get_natal_chart(*natal_key, timezone, house_system)
+    transit_subject = create_subject(*transit_key, timezone)
+    transit_chart = charts.Natal(
+        transit_subject, aspects_to=natal_chart, settings=build_call_settings(house_system)
+    )
+    return natal_chart, transit_chart
+
+
+@functools.lru_cache(maxsize=32)
+def compute_all_transit_aspects(
+    natal_key: tuple,
+    transit_key: tuple,
+    timezone: str = None,
+    house_system: str = None
+) -> tuple:
+    """
+    Build the transit-to-natal charts and aspects once per input.
+
+    Everything here is independent of the requested aspect_priority, so
+    paging through the tiers of one request reuses a single transit chart
+    and aspect list. Results are shared between calls: the aspect list
+    and tier buckets are tuples, and callers must copy an aspect (or
+    transit_data) before changing it.
+
+    Args:
+        natal_key: (date_time, latitude, longitude) of the birth
+        transit_key: (date_time, latitude, longitude) of the transits
+        timezone: Optional IANA timezone name, applied to both datetimes
+        house_system: Optional per-call house system name
+
+    Returns:
+        Tuple of (natal_chart, transit_chart, transit_data, aspects,
+        (tight, moderate, loose)): aspects is the named, self-aspect-free
+        tuple in chart order and the buckets are its priority tiers.
+    """
+    natal_chart, transit_chart = get_transit_to_natal_charts(
+        natal_key, transit_key, timezone, house_system
+    )
+
+    natal_data = json.loads(json.dumps(natal_chart, cls=ToJSON))
+    transit_data = json.loads(json.dumps(transit_chart, cls=ToJSON))
+
+    aspects = normalize_aspects_to_list(transit_data.get('aspects', {}), filter_self_aspects=True)
+
+    # Name lookup for both charts: {object_index: object_name}
+    object_names = {}
+    for data in (transit_data, natal_data):
+        for obj_data in data.get('objects', {}).values():
+            if isinstance(obj_data, dict) and 'index' in obj_data and 'name' in obj_data:
+                object_names[obj_data['index']] = obj_data['name']
+
+    # Add object1 and object2 fields to each aspect, plus the direction.
+    # active/passive are speed-ordered by immanuel and say nothing about
+    # which chart each object belongs to; from_index/to_index (captured
+    # from the nested aspect structure) do: from = transiting object,
+    # to = natal object.
+    for aspect in aspects:
+        if isinstance(aspect, dict):
+            active_id = aspect.get('active')
+            passive_id = aspect.get('passive')
+            if active_id in object_names:
+                aspect['object1'] = object_names[active_id]
+            if passive_id in object_names:
+                aspect['object2'] = object_names[passive_id]
+            from_id = aspect.pop('from_index', None)
+            to_id = aspect.pop('to_index', None)
+            if from_id in object_names and to_id in object_names:
+                aspect['transiting_object'] = object_names[from_id]
+                aspect['natal_object'] = object_names[to_id]
+
+    tiers = tuple(tuple(bucket) for bucket in classify_all_aspects(aspects))
+    return natal_chart, transit_chart, transit_data, tuple(aspects), tiers
+
+
+def clear_chart_cache() -> None:
+    """
+    Drop every cached chart and the lifecycle data memoized for them
+    (e.g. after the global settings change).
+    """
+    get_natal_chart.cache_clear()
+    get_transit_to_natal_charts.cache_clear()
+    compute_all_transit_aspects.cache_clear()
+    clear_lifecycle_cache()
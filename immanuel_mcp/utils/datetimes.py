@@ -5,6 +5,17 @@ from datetime import datetime
 from typing import Union
 
 
+def wall_clock_datetime(value: datetime) -> datetime:
+    """
+    Naive local wall-clock time of a datetime, to the second.
+
+    Same result as formatting with '%Y-%m-%d %H:%M:%S' and parsing it back
+    (naive, like datetimes parsed from input strings), without the string
+    round-trip. Used for the datetimes immanuel charts report.
+    """
+    return value.replace(tzinfo=None, microsecond=0)
+
+
 def parse_datetime_value(value: Union[str, datetime]) -> datetime:
     """Parse various datetime formats used throughout the API."""
     if isinstance(value, datetime):
@@ -0,0 +1,24 @@
+"""JSON encoding checks for tool responses."""
+
+import json
+from typing import Any
+
+
+def encoded_json_size(obj: Any) -> int:
+    """
+    Encode obj as JSON and return the size in bytes.
+
+    Doubles as the serializability check before a response is returned:
+    raises TypeError for values stdlib json cannot encode (datetimes,
+    dataclasses, arbitrary objects) and ValueError for NaN or Infinity,
+    which the MCP transport would reject. The size is that of the compact
+    UTF-8 encoding, close to what the transport sends.
+
+    Args:
+        obj: Response dictionary (or any JSON-compatible value)
+
+    Returns:
+        Encoded length in bytes
+    """
+    encoded = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    return len(encoded.encode())
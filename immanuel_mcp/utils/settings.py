@@ -13,19 +13,36 @@ from immanuel.const import names as names_const
 from immanuel.setup import ImmanuelSettings
 
 
-def _house_system_constants() -> dict:
-    """Map chart-const attribute names (e.g. 'WHOLE_SIGN') to their constants."""
-    display_names = dict(names_const.HOUSE_SYSTEMS)
-    return {
-        attr: getattr(chart_const, attr)
-        for attr in dir(chart_const)
-        if attr.isupper() and getattr(chart_const, attr) in display_names
-    }
+# Library lookup tables, built once at import: display names by constant,
+# and constants by chart-const attribute name (e.g. 'WHOLE_SIGN'). Shared,
+# so treat them as read-only.
+HOUSE_SYSTEM_NAMES = dict(names_const.HOUSE_SYSTEMS)
+
+HOUSE_SYSTEM_CONSTANTS = {
+    attr: getattr(chart_const, attr)
+    for attr in dir(chart_const)
+    if attr.isupper() and getattr(chart_const, attr) in HOUSE_SYSTEM_NAMES
+}
+
+PROGRESSION_METHOD_NAMES = dict(names_const.PROGRESSION_METHODS)
+
+# Aspect angle (degrees) -> display name, for list_available_settings
+ASPECT_ANGLE_NAMES = {
+    0.0: "Conjunction (0°)",
+    180.0: "Opposition (180°)",
+    90.0: "Square (90°)",
+    120.0: "Trine (120°)",
+    60.0: "Sextile (60°)",
+    150.0: "Quincunx (150°)",
+    30.0: "Semi-sextile (30°)",
+    45.0: "Semi-square (45°)",
+    135.0: "Sesquiquadrate (135°)"
+}
 
 
 def house_system_display_name(constant) -> str:
     """Human-readable name for a house-system constant (e.g. 113 -> 'Whole Sign')."""
-    return dict(names_const.HOUSE_SYSTEMS).get(constant, str(constant))
+    return HOUSE_SYSTEM_NAMES.get(constant, str(constant))
 
 
 def resolve_house_system(name: str) -> int:
@@ -39,17 +56,16 @@ def resolve_house_system(name: str) -> int:
         ValueError: If the name is unknown; the message lists every valid
                     value as "CONSTANT_NAME — Display Name".
     """
-    constants = _house_system_constants()
     key = name.strip().upper().replace(" ", "_").replace("-", "_")
-    if key not in constants:
+    if key not in HOUSE_SYSTEM_CONSTANTS:
         valid = ", ".join(
             f"{attr} — {house_system_display_name(value)}"
-            for attr, value in sorted(constants.items(), key=lambda item: item[1])
+            for attr, value in sorted(HOUSE_SYSTEM_CONSTANTS.items(), key=lambda item: item[1])
         )
         raise ValueError(
             f"Unknown house system '{name}'. Valid values: {valid}"
         )
-    return constants[key]
+    return HOUSE_SYSTEM_CONSTANTS[key]
 
 
 def build_call_settings(house_system: str = None):
@@ -100,7 +116,7 @@ def resolve_progression_method(name: str) -> int:
     """Resolve an MC progression method name (e.g. 'DAILY_HOUSES'), with validation."""
     return _resolve_named_constant(
         name, PROGRESSION_METHOD_CONSTANTS,
-        dict(names_const.PROGRESSION_METHODS), "MC progression method")
+        PROGRESSION_METHOD_NAMES, "MC progression method")
 
 
 def resolve_orb_calculation(name: str) -> int:
@@ -126,7 +142,7 @@ def reset_global_settings() -> dict:
         setattr(setup.settings, key, value)
     return {
         "house_system": house_system_display_name(setup.settings.house_system),
-        "mc_progression_method": dict(names_const.PROGRESSION_METHODS).get(
+        "mc_progression_method": PROGRESSION_METHOD_NAMES.get(
             setup.settings.mc_progression_method),
         "objects": len(setup.settings.objects),
         "aspects": len(setup.settings.aspects),
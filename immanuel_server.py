@@ -61,9 +61,21 @@ from immanuel_mcp.app import mcp
 from immanuel_mcp.utils.coordinates import parse_coordinate
 from immanuel_mcp.utils.errors import validate_inputs, handle_chart_error
 from immanuel_mcp.utils.subjects import create_subject
-from immanuel_mcp.utils.datetimes import parse_datetime_value
+from immanuel_mcp.utils.chart_cache import (
+    get_natal_chart,
+    get_transit_to_natal_charts,
+    compute_all_transit_aspects,
+    clear_chart_cache,
+)
+from immanuel_mcp.utils.datetimes import parse_datetime_value, wall_clock_datetime
+from immanuel_mcp.utils.encoding import encoded_json_size
 from immanuel_mcp.utils.settings import build_call_settings, build_applied_settings
-from immanuel_mcp.optimizers.positions import build_optimized_transit_positions
+from immanuel_mcp.optimizers.positions import (
+    build_columnar_transit_positions,
+    build_optimized_transit_positions,
+    natal_sign_names,
+    object_sign_name,
+)
 from immanuel_mcp.optimizers.dignities import build_dignities_section
 from immanuel_mcp.optimizers.aspects import build_optimized_aspects
 from immanuel_mcp.optimizers.cross_aspects import (
@@ -71,8 +83,6 @@ from immanuel_mcp.optimizers.cross_aspects import (
     build_compact_cross_aspects,
 )
 from immanuel_mcp.pagination.helpers import (
-    classify_all_aspects,
-    filter_aspects_by_priority,
     build_aspect_summary,
     build_pagination_object,
 )
@@ -122,11 +132,8 @@ def generate_compact_natal_chart(
 
         call_settings = build_call_settings(house_system)
 
-        # Create subject with optional timezone
-        subject = create_subject(date_time, lat, lon, timezone)
-
-        # Generate natal chart
-        natal = charts.Natal(subject, settings=call_settings)
+        # Generate (or reuse) the natal chart
+        natal = get_natal_chart(date_time, lat, lon, timezone, house_system)
 
         # Serialize to JSON using the compact serializer
         result = json.loads(json.dumps(natal, cls=CompactJSONSerializer))
@@ -197,11 +204,8 @@ def generate_natal_chart(
 
         call_settings = build_call_settings(house_system)
 
-        # Create subject with optional timezone
-        subject = create_subject(date_time, lat, lon, timezone)
-
-        # Generate natal chart
-        natal = charts.Natal(subject, settings=call_settings)
+        # Generate (or reuse) the natal chart
+        natal = get_natal_chart(date_time, lat, lon, timezone, house_system)
 
         # Serialize to JSON
         result = json.loads(json.dumps(natal, cls=ToJSON))
@@ -268,10 +272,7 @@ def get_chart_summary(
         lat = parse_coordinate(latitude, is_latitude=True)
         lon = parse_coordinate(longitude, is_latitude=False)
 
-        call_settings = build_call_settings(house_system)
-
-        subject = create_subject(date_time, lat, lon, timezone)
-        natal = charts.Natal(subject, settings=call_settings)
+        natal = get_natal_chart(date_time, lat, lon, timezone, house_system)
 
         # Extract key information with defensive error handling
         logger.debug(f"Natal chart created successfully. Objects type: {type(natal.objects)}")
@@ -283,14 +284,10 @@ def get_chart_summary(
 
         logger.debug(f"Retrieved objects - Sun: {sun}, Moon: {moon}, Asc: {asc}")
 
-        # Extract sign names with error handling
-        try:
-            sun_sign = sun.sign.name if (sun and hasattr(sun, 'sign') and hasattr(sun.sign, 'name')) else "Unknown"
-            moon_sign = moon.sign.name if (moon and hasattr(moon, 'sign') and hasattr(moon.sign, 'name')) else "Unknown"
-            rising_sign = asc.sign.name if (asc and hasattr(asc, 'sign') and hasattr(asc.sign, 'name')) else "Unknown"
-        except AttributeError as e:
-            logger.error(f"Error accessing sign names: {e}")
-            sun_sign = moon_sign = rising_sign = "Unknown"
+        # Extract sign names ("Unknown" when an object or its sign is missing)
+        sun_sign = object_sign_name(sun)
+        moon_sign = object_sign_name(moon)
+        rising_sign = object_sign_name(asc)
 
         # Extract other chart properties with error handling
         try:
@@ -367,10 +364,7 @@ def get_planetary_positions(
         lat = parse_coordinate(latitude, is_latitude=True)
         lon = parse_coordinate(longitude, is_latitude=False)
 
-        call_settings = build_call_settings(house_system)
-
-        subject = create_subject(date_time, lat, lon, timezone)
-        natal = charts.Natal(subject, settings=call_settings)
+        natal = get_natal_chart(date_time, lat, lon, timezone, house_system)
         
         planets = {}
         planet_names = {
@@ -469,7 +463,7 @@ def generate_solar_return_chart(
         subject = create_subject(date_time, lat, lon, timezone)
 
         # Generate charts
-        natal_chart = charts.Natal(subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
 
         if relocated:
             # The return moment depends only on the Sun's geocentric longitude
@@ -504,7 +498,7 @@ def generate_solar_return_chart(
         solar_return_dt_obj = getattr(solar_return, 'solar_return_date_time', None)
         if solar_return_dt_obj and hasattr(solar_return_dt_obj, 'datetime'):
             # It's a wrapped DateTime object, extract the datetime
-            solar_return_dt = solar_return_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
+            solar_return_dt = wall_clock_datetime(solar_return_dt_obj.datetime)
         elif solar_return_dt_obj:
             # Try to convert to string
             solar_return_dt = str(solar_return_dt_obj)
@@ -621,7 +615,7 @@ def generate_compact_solar_return_chart(
         subject = create_subject(date_time, lat, lon, timezone)
 
         # Generate charts
-        natal_chart = charts.Natal(subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
 
         if relocated:
             # The return moment depends only on the Sun's geocentric longitude
@@ -657,7 +651,7 @@ def generate_compact_solar_return_chart(
         solar_return_dt_obj = getattr(solar_return, 'solar_return_date_time', None)
         if solar_return_dt_obj and hasattr(solar_return_dt_obj, 'datetime'):
             # It's a wrapped DateTime object, extract the datetime
-            solar_return_dt = solar_return_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
+            solar_return_dt = wall_clock_datetime(solar_return_dt_obj.datetime)
         elif solar_return_dt_obj:
             # Try to convert to string
             solar_return_dt = str(solar_return_dt_obj)
@@ -748,7 +742,7 @@ def generate_progressed_chart(
         subject = create_subject(date_time, lat, lon, timezone)
 
         # Generate charts
-        natal_chart = charts.Natal(subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
         progressed = charts.Progressed(subject, progression_date_time, settings=call_settings)
 
         # Serialize to JSON
@@ -771,7 +765,7 @@ def generate_progressed_chart(
         progression_dt_obj = getattr(progressed, 'progression_date_time', None)
         if progression_dt_obj and hasattr(progression_dt_obj, 'datetime'):
             # It's a wrapped DateTime object, extract the datetime
-            progression_dt_value = progression_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
+            progression_dt_value = wall_clock_datetime(progression_dt_obj.datetime)
         elif progression_dt_obj:
             # Try to convert to string
             progression_dt_value = str(progression_dt_obj)
@@ -872,7 +866,7 @@ def generate_compact_progressed_chart(
         subject = create_subject(date_time, lat, lon, timezone)
 
         # Generate charts
-        natal_chart = charts.Natal(subject, settings=call_settings)
+        natal_chart = get_natal_chart(date_time, lat, lon, timezone, house_system)
         progressed = charts.Progressed(subject, progression_date_time, settings=call_settings)
 
         # Serialize to JSON using the compact serializer
@@ -896,7 +890,7 @@ def generate_compact_progressed_chart(
         progression_dt_obj = getattr(progressed, 'progression_date_time', None)
         if progression_dt_obj and hasattr(progression_dt_obj, 'datetime'):
             # It's a wrapped DateTime object, extract the datetime
-            progression_dt_value = progression_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
+            progression_dt_value = wall_clock_datetime(progression_dt_obj.datetime)
         elif progression_dt_obj:
             # Try to convert to string
             progression_dt_value = str(progression_dt_obj)
@@ -1343,7 +1337,8 @@ def generate_transit_to_natal(
     aspect_priority: str = "tight",  # Changed from "all" to "tight" for MCP size safety
     include_all_aspects: bool = False,
     include_lifecycle_events: bool = True,
-    house_system: str = None
+    house_system: str = None,
+    positions_layout: str = "named"
 ) -> Dict[str, Any]:
     """
     Calculates transiting planet aspects to a natal chart for a specific date.
@@ -1372,6 +1367,11 @@ def generate_transit_to_natal(
         house_system: Optional house system for this call only (e.g., 'CAMPANUS',
                       'WHOLE_SIGN'). Applied to both natal and transit charts.
                       Does not affect the session-global settings.
+        positions_layout: "named" (default) keys transit_positions by planet name
+                          with formatted position strings; "columnar" returns
+                          parallel lists (names, longitude, declination,
+                          retrograde, out_of_bounds, house) with numeric degrees
+                          and the flags as 0/1, which is smaller on the wire.
 
     Returns:
         Dictionary containing natal chart summary, transit positions, paginated aspects,
@@ -1399,106 +1399,25 @@ def generate_transit_to_natal(
         transit_lon = parse_coordinate(transit_longitude, is_latitude=False) if transit_longitude else natal_lon
         logger.debug(f"[TRANSIT-FULL] Transit coords: lat={transit_lat}, lon={transit_lon}")
 
-        call_settings = build_call_settings(house_system)
-
-        # Create natal and transit subjects. The optional timezone applies to
-        # both datetimes; when omitted, immanuel infers it from coordinates.
-        logger.debug(f"[TRANSIT-FULL] Creating natal subject")
-        natal_subject = create_subject(natal_date_time, natal_lat, natal_lon, timezone)
-
-        # Create transit subject for the specified date
-        logger.debug(f"[TRANSIT-FULL] Creating transit subject")
-        transit_subject = create_subject(transit_date_time, transit_lat, transit_lon, timezone)
-
-        # Generate natal chart
-        logger.debug(f"[TRANSIT-FULL] Generating natal chart")
-        natal_chart = charts.Natal(natal_subject, settings=call_settings)
-
-        # Generate transit chart with aspects to natal
-        logger.debug(f"[TRANSIT-FULL] Generating transit chart with aspects to natal")
-        transit_chart = charts.Natal(transit_subject, aspects_to=natal_chart, settings=call_settings)
-
-        # Serialize both charts
-        logger.debug(f"[TRANSIT-FULL] Serializing natal chart with ToJSON")
-        natal_data = json.loads(json.dumps(natal_chart, cls=ToJSON))
-        logger.debug(f"[TRANSIT-FULL] Serializing transit chart with ToJSON")
-        transit_data = json.loads(json.dumps(transit_chart, cls=ToJSON))
-        logger.debug(f"[TRANSIT-FULL] Serialization complete")
+        # Charts and the full aspect list don't depend on aspect_priority, so
+        # they are computed once per natal/transit input and shared by every
+        # tier. The optional timezone applies to both datetimes; when
+        # omitted, immanuel infers it from coordinates.
+        logger.debug(f"[TRANSIT-FULL] Computing (or reusing) charts and aspects")
+        natal_chart, transit_chart, transit_data, filtered_aspects, tiers = compute_all_transit_aspects(
+            (natal_date_time, natal_lat, natal_lon),
+            (transit_date_time, transit_lat, transit_lon),
+            timezone,
+            house_system
+        )
+        tight_aspects, moderate_aspects, loose_aspects = tiers
 
         # Extract natal summary using direct chart object access (not from JSON)
         # This avoids the "Unknown" bug by accessing objects before serialization
         logger.debug(f"[TRANSIT-FULL] Extracting natal summary")
-        sun_sign = "Unknown"
-        moon_sign = "Unknown"
-        rising_sign = "Unknown"
-
-        try:
-            sun = natal_chart.objects.get(chart_const.SUN)
-            if sun and hasattr(sun, 'sign') and hasattr(sun.sign, 'name'):
-                sun_sign = sun.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract sun sign: {e}")
-
-        try:
-            moon = natal_chart.objects.get(chart_const.MOON)
-            if moon and hasattr(moon, 'sign') and hasattr(moon.sign, 'name'):
-                moon_sign = moon.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract moon sign: {e}")
-
-        try:
-            asc = natal_chart.objects.get(chart_const.ASC)
-            if asc and hasattr(asc, 'sign') and hasattr(asc.sign, 'name'):
-                rising_sign = asc.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract rising sign: {e}")
-
-        # Build result with natal summary and transit aspects
-        logger.debug(f"[TRANSIT-FULL] Building result dictionary")
-
-        # Filter self-aspects from the aspects dictionary
-        # normalize_aspects_to_list will flatten the nested dict and remove self-aspects
-        filtered_aspects = normalize_aspects_to_list(
-            transit_data.get('aspects', {}),
-            filter_self_aspects=True
-        )
-
-        # Add object names to aspects for readability (like compact serializer does)
-        # Create lookup dict: {object_index: object_name}
-        object_names = {}
-        for obj_key, obj_data in transit_data.get('objects', {}).items():
-            if isinstance(obj_data, dict) and 'index' in obj_data and 'name' in obj_data:
-                object_names[obj_data['index']] = obj_data['name']
-
-        # Also add natal object names
-        for obj_key, obj_data in natal_data.get('objects', {}).items():
-            if isinstance(obj_data, dict) and 'index' in obj_data and 'name' in obj_data:
-                object_names[obj_data['index']] = obj_data['name']
-
-        # Add object1 and object2 fields to each aspect, plus the direction.
-        # active/passive are speed-ordered by immanuel and say nothing about
-        # which chart each object belongs to; from_index/to_index (captured
-        # from the nested aspect structure) do: from = transiting object,
-        # to = natal object.
-        for aspect in filtered_aspects:
-            if isinstance(aspect, dict):
-                active_id = aspect.get('active')
-                passive_id = aspect.get('passive')
-                if active_id in object_names:
-                    aspect['object1'] = object_names[active_id]
-                if passive_id in object_names:
-                    aspect['object2'] = object_names[passive_id]
-                from_id = aspect.pop('from_index', None)
-                to_id = aspect.pop('to_index', None)
-                if from_id in object_names and to_id in object_names:
-                    aspect['transiting_object'] = object_names[from_id]
-                    aspect['natal_object'] = object_names[to_id]
+        sun_sign, moon_sign, rising_sign = natal_sign_names(natal_chart)
 
         logger.info(f"[TRANSIT-FULL] Total aspects after filtering: {len(filtered_aspects)}")
-
-        # === PAGINATION LOGIC ===
-        # Classify all aspects by priority tier
-        tight_aspects, moderate_aspects, loose_aspects = classify_all_aspects(filtered_aspects)
         logger.info(f"[TRANSIT-FULL] Classified aspects - tight: {len(tight_aspects)}, moderate: {len(moderate_aspects)}, loose: {len(loose_aspects)}")
 
         # Determine which aspects to return. The deprecated include_all_aspects
@@ -1523,8 +1442,14 @@ def generate_transit_to_natal(
             )
             aspect_priority = "tight"
 
-        # Filter by requested priority
-        aspects_to_return = filter_aspects_by_priority(filtered_aspects, aspect_priority)
+        # Select the requested tier (already bucketed). The buckets are
+        # shared with the chart cache, so the response works on copies.
+        aspects_to_return = [dict(aspect) for aspect in {
+            "tight": tight_aspects,
+            "moderate": moderate_aspects,
+            "loose": loose_aspects,
+            "all": filtered_aspects
+        }[aspect_priority]]
         effective_priority = aspect_priority
         logger.info(f"[TRANSIT-FULL] Returning {len(aspects_to_return)} {effective_priority} aspects")
 
@@ -1546,7 +1471,12 @@ def generate_transit_to_natal(
 
         # === OPTIMIZE RESPONSE STRUCTURE ===
         # Use optimized builders to reduce response size by 60-70%
-        optimized_positions = build_optimized_transit_positions(transit_data)
+        if positions_layout == "columnar":
+            optimized_positions = build_columnar_transit_positions(transit_data)
+        else:
+            if positions_layout != "named":
+                logger.warning(f"[TRANSIT-FULL] Invalid positions_layout '{positions_layout}', defaulting to 'named'")
+            optimized_positions = build_optimized_transit_positions(transit_data)
         optimized_aspects = build_optimized_aspects(aspects_to_return)
         dignities = build_dignities_section(transit_data)
 
@@ -1574,7 +1504,8 @@ def generate_transit_to_natal(
                 natal_chart=natal_chart,
                 comparison_chart=transit_chart,
                 birth_datetime=natal_date_time,
-                comparison_datetime=transit_date_time
+                comparison_datetime=transit_date_time,
+                cached_charts=True
             )
         else:
             result["lifecycle_events"] = None
@@ -1583,8 +1514,7 @@ def generate_transit_to_natal(
         # Verify result is JSON serializable before returning
         logger.debug("[TRANSIT-FULL] Verifying JSON serializability")
         try:
-            json_test = json.dumps(result)
-            result_size = len(json_test) / 1024
+            result_size = encoded_json_size(result) / 1024
             logger.info(f"[TRANSIT-FULL] Result successfully serialized, size: {result_size:.2f} KB")
         except (TypeError, ValueError) as e:
             logger.error(f"[TRANSIT-FULL] CRITICAL: Result not JSON serializable: {e}")
@@ -1649,20 +1579,16 @@ def generate_compact_transit_to_natal(
         transit_lat = parse_coordinate(transit_latitude, is_latitude=True) if transit_latitude else natal_lat
         transit_lon = parse_coordinate(transit_longitude, is_latitude=False) if transit_longitude else natal_lon
 
-        call_settings = build_call_settings(house_system)
-
-        # Create natal and transit subjects. The optional timezone applies to
-        # both datetimes; when omitted, immanuel infers it from coordinates.
-        natal_subject = create_subject(natal_date_time, natal_lat, natal_lon, timezone)
-
-        # Create transit subject for the specified date
-        transit_subject = create_subject(transit_date_time, transit_lat, transit_lon, timezone)
-
-        # Generate natal chart
-        natal_chart = charts.Natal(natal_subject, settings=call_settings)
-
-        # Generate transit chart with aspects to natal
-        transit_chart = charts.Natal(transit_subject, aspects_to=natal_chart, settings=call_settings)
+        # Generate (or reuse, e.g. after the full transit-to-natal call) the
+        # natal chart and the transit chart with aspects to it. The optional
+        # timezone applies to both datetimes; when omitted, immanuel infers
+        # it from coordinates.
+        natal_chart, transit_chart = get_transit_to_natal_charts(
+            (natal_date_time, natal_lat, natal_lon),
+            (transit_date_time, transit_lat, transit_lon),
+            timezone,
+            house_system
+        )
 
         # Serialize transit chart using compact serializer
         transit_data = json.loads(json.dumps(transit_chart, cls=CompactJSONSerializer))
@@ -1680,30 +1606,7 @@ def generate_compact_transit_to_natal(
 
         # Extract natal summary using direct chart object access (not from JSON)
         # This avoids the "Unknown" bug by accessing objects before serialization
-        sun_sign = "Unknown"
-        moon_sign = "Unknown"
-        rising_sign = "Unknown"
-
-        try:
-            sun = natal_chart.objects.get(chart_const.SUN)
-            if sun and hasattr(sun, 'sign') and hasattr(sun.sign, 'name'):
-                sun_sign = sun.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract sun sign: {e}")
-
-        try:
-            moon = natal_chart.objects.get(chart_const.MOON)
-            if moon and hasattr(moon, 'sign') and hasattr(moon.sign, 'name'):
-                moon_sign = moon.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract moon sign: {e}")
-
-        try:
-            asc = natal_chart.objects.get(chart_const.ASC)
-            if asc and hasattr(asc, 'sign') and hasattr(asc.sign, 'name'):
-                rising_sign = asc.sign.name
-        except Exception as e:
-            logger.debug(f"Could not extract rising sign: {e}")
+        sun_sign, moon_sign, rising_sign = natal_sign_names(natal_chart)
 
         # Build compact result
         result = {
@@ -1727,7 +1630,8 @@ def generate_compact_transit_to_natal(
                 natal_chart=natal_chart,
                 comparison_chart=transit_chart,
                 birth_datetime=natal_date_time,
-                comparison_datetime=transit_date_time
+                comparison_datetime=transit_date_time,
+                cached_charts=True
             )
         else:
             result["lifecycle_events"] = None
@@ -1797,6 +1701,9 @@ def configure_immanuel_settings(
         settings = setup.settings
         old_value = getattr(settings, setting_key, None)
 
+        # Cached natal charts were built under the settings about to change
+        clear_chart_cache()
+
         # Special handling for different setting types
         if setting_key == 'house_system':
             # Convert string to constant, with validation listing valid names
@@ -1901,6 +1808,7 @@ def reset_immanuel_settings() -> Dict[str, Any]:
 
         logger.info("Resetting Immanuel settings to library defaults")
         restored = reset_global_settings()
+        clear_chart_cache()
         return {
             "status": "success",
             "message": "Immanuel settings restored to library defaults.",
@@ -1923,39 +1831,22 @@ def list_available_settings() -> Dict[str, Any]:
     """
     try:
         from immanuel import setup
-        from immanuel.const import names as names_const
+        from immanuel_mcp.utils.settings import ASPECT_ANGLE_NAMES, HOUSE_SYSTEM_NAMES
         settings = setup.settings
 
-        # House system mapping straight from the library so new systems
-        # never show up as "Unknown"
-        HOUSE_SYSTEMS = dict(names_const.HOUSE_SYSTEMS)
-
-        # Aspect angle mapping (degrees to aspect names)
-        ASPECT_ANGLES = {
-            0.0: "Conjunction (0°)",
-            180.0: "Opposition (180°)",
-            90.0: "Square (90°)",
-            120.0: "Trine (120°)",
-            60.0: "Sextile (60°)",
-            150.0: "Quincunx (150°)",
-            30.0: "Semi-sextile (30°)",
-            45.0: "Semi-square (45°)",
-            135.0: "Sesquiquadrate (135°)"
-        }
-
         # Get current values
         house_system_code = getattr(settings, 'house_system', None)
-        house_system_name = HOUSE_SYSTEMS.get(house_system_code, f"Unknown ({house_system_code})")
+        house_system_name = HOUSE_SYSTEM_NAMES.get(house_system_code, f"Unknown ({house_system_code})")
 
         current_aspects = getattr(settings, 'aspects', [])
-        aspect_names = [ASPECT_ANGLES.get(angle, f"{angle}°") for angle in current_aspects]
+        aspect_names = [ASPECT_ANGLE_NAMES.get(angle, f"{angle}°") for angle in current_aspects]
 
         setting_info = {
             'house_system': {
                 'current': house_system_code,
                 'name': house_system_name,
                 'description': 'House system used for chart calculations',
-                'available_systems': list(HOUSE_SYSTEMS.values())
+                'available_systems': list(HOUSE_SYSTEM_NAMES.values())
             },
             'locale': {
                 'current': getattr(settings, 'locale', None),
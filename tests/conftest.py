@@ -0,0 +1,216 @@
+"""Shared pytest fixtures for the Immanuel MCP test suite."""
+
+import functools
+import os
+import pickle
+import tempfile
+from datetime import datetime
+from importlib.metadata import version
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+CHART_CLASSES = ('Natal', 'SolarReturn', 'Progressed', 'Composite', 'Transits')
+
+
+class FakeSubject:
+    """Stand-in for charts.Subject that just keeps its constructor kwargs."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeChart:
+    """Stand-in for an immanuel chart.
+
+    Serializes to ``payload`` and exposes only the attributes immanuel_server
+    reads off a chart (``objects`` plus whatever is passed as keywords).
+    """
+
+    def __init__(self, payload=None, objects=None, **attrs):
+        self._payload = payload if payload is not None else {}
+        self.objects = objects if objects is not None else {}
+        self.__dict__.update(attrs)
+
+    def __json__(self):
+        return self._payload
+
+
+@pytest.fixture(scope="class")
+def stub_charts():
+    """Install the chart fakes once per test class.
+
+    Every chart class returns ``state['chart']``, charts.Subject becomes
+    FakeSubject and lifecycle attachment is disabled; tests swap the chart
+    through fast_chart_mocks instead of re-patching. The natal chart cache is
+    cleared on the way in and out so fakes and real charts never mix.
+    """
+    from immanuel_mcp.utils.chart_cache import clear_chart_cache
+
+    state = {'chart': FakeChart()}
+    clear_chart_cache()
+    mp = pytest.MonkeyPatch()
+    for name in CHART_CLASSES:
+        mp.setattr(f'immanuel_server.charts.{name}', lambda *args, **kwargs: state['chart'])
+    mp.setattr('immanuel_server.charts.Subject', FakeSubject)
+    mp.setattr('immanuel_server.attach_lifecycle_section', lambda *args, **kwargs: None)
+    yield state
+    mp.undo()
+    clear_chart_cache()
+
+
+@pytest.fixture
+def fast_chart_mocks(stub_charts):
+    """Point the class-wide chart stubs at a prebuilt FakeChart.
+
+    Returns an installer: ``fast_chart_mocks(payload, **attrs)`` makes every
+    chart class return one FakeChart built from its arguments (and returns
+    it).
+    """
+    from immanuel_mcp.utils.chart_cache import clear_chart_cache
+
+    def install(payload=None, **attrs):
+        clear_chart_cache()
+        stub_charts['chart'] = FakeChart(payload, **attrs)
+        return stub_charts['chart']
+
+    return install
+
+
+@pytest.fixture
+def isolated_settings(monkeypatch):
+    """Replace the global immanuel settings singleton for one test."""
+    mock_settings = MagicMock()
+    monkeypatch.setattr('immanuel.setup.settings', mock_settings)
+    yield mock_settings
+
+
+@functools.lru_cache(maxsize=64)
+def build_natal(date_time, latitude, longitude):
+    """Natal chart and parsed datetime, built once per unique input.
+
+    Charts are shared between callers, so treat them as read-only. The
+    datetime is parsed here too, so each date string is parsed once per
+    process (fromisoformat accepts the space separator directly).
+    """
+    from immanuel import charts
+    subject = charts.Subject(date_time=date_time, latitude=latitude, longitude=longitude)
+    return charts.Natal(subject), datetime.fromisoformat(date_time)
+
+
+@pytest.fixture(scope="session")
+def natal_chart_factory():
+    """build_natal: (date_time, latitude, longitude) -> (chart, datetime)."""
+    return build_natal
+
+
+def chart_key(date_time, latitude, longitude):
+    """Hashable build_natal key; coordinates rounded so float noise can't miss."""
+    return date_time, round(latitude, 6), round(longitude, 6)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_cached(natal_key, transit_key, include_future=True, future_years=20, max_future_events=10):
+    """detect_lifecycle_events for two chart keys, memoized per input.
+
+    The result is shared between callers, so treat it as read-only.
+    """
+    from immanuel_mcp.lifecycle import detect_lifecycle_events
+    natal_chart, birth_dt = build_natal(*natal_key)
+    transit_chart, transit_dt = build_natal(*transit_key)
+    return detect_lifecycle_events(
+        natal_chart, transit_chart, birth_dt, transit_dt,
+        include_future=include_future,
+        future_years=future_years,
+        max_future_events=max_future_events
+    )
+
+
+@pytest.fixture(scope="session")
+def lifecycle_events():
+    """_detect_cached: (natal_key, transit_key, ...) -> lifecycle events."""
+    return _detect_cached
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_pickled_chart(name, build):
+    """Chart from tests/fixtures/<name>-immanuel<version>.pkl, built on first use.
+
+    Unpickling skips the ephemeris entirely; the immanuel version in the
+    filename keeps a library upgrade from loading stale objects. Set
+    REBUILD_FIXTURES=1 to regenerate.
+    """
+    path = FIXTURES_DIR / f"{name}-immanuel{version('immanuel')}.pkl"
+    if path.exists() and not os.environ.get("REBUILD_FIXTURES"):
+        with path.open("rb") as f:
+            return pickle.load(f)
+
+    chart = build()
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    # Write to a temp file and rename into place, so a concurrent xdist
+    # worker never unpickles a half-written fixture.
+    fd, tmp_path = tempfile.mkstemp(dir=FIXTURES_DIR, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(chart, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return chart
+
+
+@pytest.fixture(scope="session")
+def cached_natal_1990():
+    """Natal chart for 1990-01-15 12:00 in London (51.5074, -0.1278), pickled."""
+    def build():
+        from immanuel import charts
+        return charts.Natal(charts.Subject("1990-01-15 12:00:00", 51.5074, -0.1278))
+
+    return load_pickled_chart("natal_1990", build)
+
+
+# Reference transit-to-natal request shared by the full-endpoint inspection tests.
+TRANSIT_PARAMS = {
+    "natal_date_time": "1984-01-11 18:45:00",
+    "natal_latitude": "51n23",
+    "natal_longitude": "0w05",
+    "transit_date_time": "2025-12-20 12:00:00",
+    "transit_latitude": "51n34",
+    "transit_longitude": "0w09",
+    "timezone": "Europe/London"
+}
+
+
+# Natal coordinate notations the tools accept: test id -> (name, latitude, longitude).
+COORDINATE_FORMATS = {
+    "decimal": ("Decimal", "51.5074", "-0.1278"),
+    "dms-nw": ("DMS North/West", "51n30", "0w08"),
+    "dms-east": ("DMS with East (Bug #2)", "40n45", "73e59"),  # the 'E' direction fix
+    "space-sep": ("Space-separated", "51 30 N", "0 08 W"),
+}
+
+
+@pytest.fixture(params=list(COORDINATE_FORMATS.values()), ids=list(COORDINATE_FORMATS))
+def coord_format(request):
+    """One (name, latitude, longitude) entry of COORDINATE_FORMATS per test."""
+    return request.param
+
+
+@functools.lru_cache(maxsize=None)
+def cached_transit_to_natal(**params):
+    """generate_transit_to_natal memoized on its inputs for this process.
+
+    The result is shared between callers, so treat it as read-only.
+    """
+    from immanuel_server import generate_transit_to_natal
+    return generate_transit_to_natal(**params)
+
+
+@pytest.fixture(scope="session")
+def transit_result():
+    """Full transit-to-natal response for TRANSIT_PARAMS, computed once."""
+    return cached_transit_to_natal(**TRANSIT_PARAMS)
@@ -4,11 +4,8 @@ Comprehensive Test Suite for All Bug Fixes
 Tests issues #2, #3, and #4
 """
 
-import sys
 import json
 from datetime import datetime
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from immanuel_server import (
     generate_compact_progressed_chart,
@@ -22,7 +22,8 @@ import pytest
 
 import immanuel_server
 from immanuel_mcp.charts import lunar_return as lunar_return_module
-from immanuel_mcp.pagination.helpers import classify_aspect_priority, get_actual_orb
+from immanuel_mcp.lifecycle.returns import arc_distance
+from immanuel_mcp.pagination.helpers import classify_all_aspects, classify_aspect_priority, get_actual_orb
 from immanuel_mcp.utils.coordinates import parse_coordinate
 from immanuel_mcp.utils.datetimes import parse_datetime_value
 
@@ -89,6 +90,13 @@ def test_get_actual_orb_compact_serializer_shape():
     assert classify_aspect_priority({"orb": -3.4}) == "moderate"
 
 
+def test_nan_orb_is_loose():
+    # A missing/bad orb must not be promoted into the default "tight" page
+    aspect = {"difference": {"raw": float("nan")}}
+    assert classify_aspect_priority(aspect) == "loose"
+    assert classify_all_aspects([aspect]) == ([], [], [aspect])
+
+
 def test_transit_to_natal_tight_page_is_actually_tight():
     result = immanuel_server.generate_transit_to_natal(*BIRTH, TRANSIT_DATE)
     assert not result.get("error"), result
@@ -112,9 +120,10 @@ def test_all_tools_registered_on_shared_instance():
     assert modular_server.mcp is shared
 
     tools = {t.name for t in asyncio.run(shared.list_tools())}
-    assert len(tools) == 21
+    assert len(tools) == 22
     assert "generate_lunar_return_chart" in tools
     assert "generate_compact_lunar_return_chart" in tools
+    assert "generate_annual_lunar_returns" in tools
     assert "reset_immanuel_settings" in tools
 
 
@@ -205,8 +214,7 @@ def test_lunar_return_precision():
         date_time=info["return_date"].replace("T", " "),
         latitude=32.71, longitude=-117.15, timezone="America/Los_Angeles")
     moon = charts.Natal(subject).objects.get(4000002)
-    diff = abs(moon.longitude.raw - info["natal_moon_longitude"])
-    diff = min(diff, 360 - diff)
+    diff = arc_distance(moon.longitude.raw, info["natal_moon_longitude"])
     # 0.01 deg of Moon motion is ~1 minute of clock time
     assert diff < 0.01, f"Moon {diff} deg from natal position at return moment"
 
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 """Test the compact transit-to-natal function directly"""
 
-import sys
 import json
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from immanuel_server import generate_compact_transit_to_natal
 
@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 """Test that aspect interpretations vary by planetary combination."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from immanuel_server import generate_compact_transit_to_natal
 
 
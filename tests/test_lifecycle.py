@@ -4,264 +4,214 @@ Test Lifecycle Events Detection
 
 Tests the lifecycle events system with known astrological returns and transits.
 
-Test Cases:
+Test cases (CASES, one test node each):
 1. Saturn Return (exact case from validation): Jan 11, 1984 → Nov 11, 2013
 2. No active returns (young age): Jan 15, 1990 → Jun 20, 2012 (age 22)
-3. Multiple simultaneous events (if possible)
-4. Very young age (edge case)
-"""
-
-import sys
-from datetime import datetime
-
-# Import the lifecycle detection directly
-from immanuel_mcp.lifecycle import detect_lifecycle_events
-from immanuel import charts
-from immanuel.const import chart as chart_const
-
-
-def create_charts(natal_dt_str, transit_dt_str, natal_lat=51.38, natal_lon=-0.08):
-    """Helper to create natal and transit charts."""
-    # Parse datetime strings
-    natal_dt = datetime.fromisoformat(natal_dt_str.replace(' ', 'T'))
-    transit_dt = datetime.fromisoformat(transit_dt_str.replace(' ', 'T'))
-
-    # Create subjects
-    natal_subject = charts.Subject(
-        date_time=natal_dt_str,
-        latitude=natal_lat,
-        longitude=natal_lon
-    )
-    transit_subject = charts.Subject(
-        date_time=transit_dt_str,
-        latitude=natal_lat,
-        longitude=natal_lon
-    )
-
-    # Generate charts
-    natal_chart = charts.Natal(natal_subject)
-    transit_chart = charts.Natal(transit_subject)
+3. Jupiter Return (age ~12): Jan 15, 1990 → Dec 15, 2001
+4. Past events summary (age 45): Jan 15, 1979 → Jun 15, 2024
 
-    return natal_chart, transit_chart, natal_dt, transit_dt
+The cases are independent, so they can run in parallel:
+    uv run pytest tests/test_lifecycle.py -n auto
 
+Diagnostics go to DEBUG logging; show them with:
+    uv run pytest tests/test_lifecycle.py -o log_cli=true --log-cli-level=DEBUG
+"""
 
-def test_saturn_return():
-    """
-    Test Case 1: Known Saturn Return
-    Natal: Jan 11, 1984, 18:45:00 UTC (51n23, 0w05)
-    Transit: Nov 11, 2013, 00:50:00 UTC
-    Expected: Saturn Return active with orb ~0.8°
-    """
-    print("\n" + "="*70)
-    print("TEST 1: Saturn Return (Known Case from Validation)")
-    print("="*70)
-
-    natal_chart, transit_chart, natal_dt, transit_dt = create_charts(
-        "1984-01-11 18:45:00",
-        "2013-11-11 00:50:00",
-        natal_lat=51.38,  # 51n23
-        natal_lon=-0.08   # 0w05
-    )
+import logging
 
-    # Debug: Check Saturn positions
-    from immanuel.const import chart as chart_const
-    natal_saturn = natal_chart.objects.get(chart_const.SATURN)
-    transit_saturn = transit_chart.objects.get(chart_const.SATURN)
-    print(f"\nDEBUG - Natal Saturn: {natal_saturn.longitude.raw:.2f} deg in {natal_saturn.sign.name}")
-    print(f"DEBUG - Transit Saturn: {transit_saturn.longitude.raw:.2f} deg in {transit_saturn.sign.name}")
-    print(f"DEBUG - Difference: {abs(transit_saturn.longitude.raw - natal_saturn.longitude.raw):.2f} deg")
-
-    # Detect lifecycle events
-    events = detect_lifecycle_events(
-        natal_chart, transit_chart, natal_dt, transit_dt
-    )
+import pytest
 
-    # Print results
-    print(f"\nAge: {events['lifecycle_summary']['current_age']}")
-    print(f"Current Stage: {events['lifecycle_summary']['current_stage']['stage_name']}")
-    print(f"Active Events: {events['lifecycle_summary']['active_event_count']}")
-    print(f"Highest Significance: {events['lifecycle_summary']['highest_significance']}")
-
-    if events['current_events']:
-        print("\nCurrent Active Events:")
-        for event in events['current_events']:
-            if event['event_type'] == 'return':
-                print(f"  • {event['planet']} Return #{event['cycle_number']}")
-                print(f"    Orb: {event['orb']}° ({event['orb_status']})")
-                print(f"    Significance: {event['significance']}")
-                print(f"    Natal: {event['natal_position']}°, Transit: {event['transit_position']}°")
-            else:
-                print(f"  • {event['name']}")
-                print(f"    Orb: {event['orb']}° ({event['orb_status']})")
-                print(f"    Significance: {event['significance']}")
-
-    # Validation
-    assert events['lifecycle_summary']['active_event_count'] > 0, "Expected at least 1 active event"
-
-    # Check if Saturn Return is present
-    saturn_return_found = False
-    for event in events['current_events']:
-        if event.get('planet') == 'Saturn' and event.get('type') == 'saturn_return':
-            saturn_return_found = True
-            print(f"\n✅ Saturn Return detected with orb {event['orb']}°")
-            assert abs(event['orb']) <= 2.0, f"Expected orb ≤ 2°, got {event['orb']}°"
-            assert event['cycle_number'] == 1, f"Expected cycle 1, got {event['cycle_number']}"
-            assert event['significance'] == 'CRITICAL', f"Expected CRITICAL, got {event['significance']}"
-            break
+from conftest import chart_key
 
-    assert saturn_return_found, "Saturn Return not detected!"
+logger = logging.getLogger(__name__)
 
-    print("\n✅ TEST 1 PASSED")
-    return events
 
+def create_charts(natal_chart_factory, natal_dt_str, transit_dt_str, natal_lat=51.38, natal_lon=-0.08):
+    """Helper to fetch (cached) natal and transit charts plus their cache keys.
 
-def test_no_active_returns():
+    Pass the keys to the lifecycle_events fixture for memoized detection.
     """
-    Test Case 2: No Active Returns (Young Age)
-    Natal: Jan 15, 1990, 12:00:00
-    Transit: Jun 20, 2012, 14:00:00 (age ~22.4)
-    Expected: No active returns, future timeline populated
-    """
-    print("\n" + "="*70)
-    print("TEST 2: No Active Returns (Age 22)")
-    print("="*70)
-
-    natal_chart, transit_chart, natal_dt, transit_dt = create_charts(
-        "1990-01-15 12:00:00",
-        "2012-06-20 14:00:00"
-    )
-
-    events = detect_lifecycle_events(
-        natal_chart, transit_chart, natal_dt, transit_dt
-    )
+    natal_key = chart_key(natal_dt_str, natal_lat, natal_lon)
+    transit_key = chart_key(transit_dt_str, natal_lat, natal_lon)
+    natal_chart, _ = natal_chart_factory(*natal_key)
+    transit_chart, _ = natal_chart_factory(*transit_key)
 
-    print(f"\nAge: {events['lifecycle_summary']['current_age']}")
-    print(f"Current Stage: {events['lifecycle_summary']['current_stage']['stage_name']}")
-    print(f"Active Events: {events['lifecycle_summary']['active_event_count']}")
+    return natal_chart, transit_chart, natal_key, transit_key
 
-    if events['future_timeline']:
-        print(f"\nNext {len(events['future_timeline'])} Upcoming Events:")
-        for event in events['future_timeline'][:3]:  # Show first 3
-            if event['event_type'] == 'return':
-                print(f"  • {event['planet']} Return #{event['cycle_number']} "
-                      f"in {event['years_until']:.1f} years (age {event['predicted_age']})")
-            else:
-                print(f"  • {event['name']} "
-                      f"in {event['years_until']:.1f} years (age {event['typical_age']})")
 
-    # Validation
-    print(f"\n✅ TEST 2 PASSED (Age {events['lifecycle_summary']['current_age']}, "
-          f"{events['lifecycle_summary']['active_event_count']} active events)")
-    return events
+def log_summary(events):
+    """Log the lifecycle summary block shared by every test case."""
+    summary = events['lifecycle_summary']
+    logger.debug("Age: %s", summary['current_age'])
+    logger.debug("Current Stage: %s", summary['current_stage']['stage_name'])
+    logger.debug("Active Events: %s", summary['active_event_count'])
 
 
-def test_jupiter_return():
-    """
-    Test Case 3: First Jupiter Return (Age ~12)
-    Natal: Jan 15, 1990, 12:00:00
-    Transit: Around age 12 (11.86 years later) ≈ Dec 2001
-    Expected: Jupiter Return active
-    """
-    print("\n" + "="*70)
-    print("TEST 3: Jupiter Return (Age ~12)")
-    print("="*70)
-
-    natal_chart, transit_chart, natal_dt, transit_dt = create_charts(
-        "1990-01-15 12:00:00",
-        "2001-12-15 12:00:00"  # ~11.9 years later
+def log_current_events(events):
+    """Log each active event with its orb."""
+    for event in events['current_events']:
+        if event['event_type'] == 'return':
+            logger.debug("%s Return #%s: orb %s° (%s), %s",
+                         event['planet'], event['cycle_number'], event['orb'],
+                         event['orb_status'], event['significance'])
+        else:
+            logger.debug("%s: orb %s° (%s), %s",
+                         event['name'], event['orb'], event['orb_status'], event['significance'])
+
+
+def assert_event_present(events, planet, cycle, significance):
+    """Assert an active return of planet/cycle within 2° and return it."""
+    event = next(
+        (event for event in events['current_events']
+         if event.get('planet') == planet and event.get('event_type') == 'return'),
+        None
     )
-
-    events = detect_lifecycle_events(
-        natal_chart, transit_chart, natal_dt, transit_dt
+    assert event is not None, f"{planet} Return not detected!"
+    assert abs(event['orb']) <= 2.0, f"Expected orb ≤ 2°, got {event['orb']}°"
+    assert event['cycle_number'] == cycle, f"Expected cycle {cycle}, got {event['cycle_number']}"
+    assert event['significance'] == significance, f"Expected {significance}, got {event['significance']}"
+    return event
+
+
+def log_timeline(events):
+    """Log the first few upcoming and past events."""
+    for event in events['future_timeline'][:3]:  # Show first 3
+        if event['event_type'] == 'return':
+            logger.debug("Upcoming: %s Return #%s in %.1f years (age %s)",
+                         event['planet'], event['cycle_number'],
+                         event['years_until'], event['predicted_age'])
+        else:
+            logger.debug("Upcoming: %s in %.1f years (age %s)",
+                         event['name'], event['years_until'], event['typical_age'])
+
+    for event in events['past_events'][:5]:  # Show first 5
+        logger.debug("Past: %s at age %s (%.1f years ago)",
+                     event['name'], event['typical_age'], event['years_ago'])
+
+
+# (natal_dt, transit_dt, lat, lon, planet, cycle, significance, min_events, min_past)
+# planet=None means no particular return is required to be active.
+CASES = [
+    # Known Saturn Return from validation (51n23, 0w05); orb ~0.8°
+    pytest.param("1984-01-11 18:45:00", "2013-11-11 00:50:00", 51.38, -0.08,
+                 "Saturn", 1, "CRITICAL", 1, 0, id="saturn_return"),
+    # Age ~22.4: no active returns, future timeline populated
+    pytest.param("1990-01-15 12:00:00", "2012-06-20 14:00:00", 51.38, -0.08,
+                 None, None, None, 0, 0, id="no_active_returns"),
+    # ~11.9 years later: Jupiter Return may fall just outside orb, so not required
+    pytest.param("1990-01-15 12:00:00", "2001-12-15 12:00:00", 51.38, -0.08,
+                 None, None, None, 0, 0, id="jupiter_return"),
+    # Age ~45.4: past milestones like Saturn Return, Chiron Opposition
+    pytest.param("1979-01-15 12:00:00", "2024-06-15 12:00:00", 51.38, -0.08,
+                 None, None, None, 0, 1, id="past_events"),
+]
+
+
+@pytest.mark.parametrize(
+    "natal_dt,transit_dt,lat,lon,planet,cycle,significance,min_events,min_past", CASES)
+def test_lifecycle_case(natal_chart_factory, lifecycle_events, natal_dt, transit_dt, lat, lon,
+                        planet, cycle, significance, min_events, min_past):
+    natal_chart, transit_chart, natal_key, transit_key = create_charts(
+        natal_chart_factory, natal_dt, transit_dt, natal_lat=lat, natal_lon=lon)
+
+    # Debug: compare positions (only resolved when DEBUG is enabled)
+    if planet and logger.isEnabledFor(logging.DEBUG):
+        from immanuel_mcp.lifecycle.returns import PLANET_CONSTANTS, arc_distance
+        natal_obj = natal_chart.objects.get(PLANET_CONSTANTS[planet])
+        transit_obj = transit_chart.objects.get(PLANET_CONSTANTS[planet])
+        logger.debug("Natal %s: %.2f deg in %s", planet, natal_obj.longitude.raw, natal_obj.sign.name)
+        logger.debug("Transit %s: %.2f deg in %s", planet, transit_obj.longitude.raw, transit_obj.sign.name)
+        logger.debug("Difference: %.2f deg", arc_distance(natal_obj.longitude.raw, transit_obj.longitude.raw))
+
+    events = lifecycle_events(natal_key, transit_key)
+    log_summary(events)
+    logger.debug("Highest Significance: %s", events['lifecycle_summary']['highest_significance'])
+    log_current_events(events)
+    log_timeline(events)
+
+    assert events['lifecycle_summary']['active_event_count'] >= min_events, \
+        f"Expected at least {min_events} active event(s)"
+    assert len(events['past_events']) >= min_past, f"Expected at least {min_past} past event(s)"
+    if planet:
+        assert_event_present(events, planet, cycle, significance)
+
+
+def test_chart_positions_built_once(natal_chart_factory):
+    """Position tables are read off the chart once and shared by later lookups."""
+    from immanuel.const import chart as chart_const
+    from immanuel_mcp.lifecycle.returns import get_chart_positions
+
+    natal_chart, _ = natal_chart_factory(*chart_key("1984-01-11 18:45:00", 51.38, -0.08))
+    positions = get_chart_positions(natal_chart)
+
+    assert get_chart_positions(natal_chart) is positions
+    assert positions["Saturn"][0] == natal_chart.objects[chart_const.SATURN].longitude.raw
+    assert positions["Saturn"][2] == natal_chart.objects[chart_const.SATURN].sign.name
+
+
+@pytest.mark.parametrize("natal_pos,transit_pos,expected", [
+    (10.0, 10.1, 10.1 - 10.0),      # small orbs keep the plain difference
+    (10.1, 10.0, 10.0 - 10.1),
+    (359.0, 1.0, 2.0),              # wrap across 0 degrees
+    (1.0, 359.0, -2.0),
+    (0.0, 180.0, 180.0),            # the +/-180 boundary is reported as given
+    (180.0, 0.0, -180.0),
+])
+def test_signed_orb_is_exact(natal_pos, transit_pos, expected):
+    """calculate_signed_orb adds no rounding error and keeps the sign at 180."""
+    from immanuel_mcp.lifecycle.returns import calculate_signed_orb
+
+    assert calculate_signed_orb(natal_pos, transit_pos) == expected
+
+
+def test_attach_memoizes_only_cached_charts(natal_chart_factory):
+    """Per-call charts bypass the lifecycle memo; cached_charts=True uses it."""
+    from immanuel_mcp.lifecycle.attach import (
+        _detect_lifecycle_cached,
+        _lifecycle_feed_cached,
+        attach_lifecycle_section,
+        clear_lifecycle_cache,
     )
 
-    print(f"\nAge: {events['lifecycle_summary']['current_age']}")
-    print(f"Current Stage: {events['lifecycle_summary']['current_stage']['stage_name']}")
-    print(f"Active Events: {events['lifecycle_summary']['active_event_count']}")
+    natal_chart, transit_chart, _, _ = create_charts(
+        natal_chart_factory, "1984-01-11 18:45:00", "2013-11-11 00:50:00")
+    args = (natal_chart, transit_chart, "1984-01-11 18:45:00", "2013-11-11 00:50:00")
+    clear_lifecycle_cache()
 
-    if events['current_events']:
-        print("\nCurrent Active Events:")
-        for event in events['current_events']:
-            if event['event_type'] == 'return':
-                print(f"  • {event['planet']} Return #{event['cycle_number']}")
-                print(f"    Orb: {event['orb']}° ({event['orb_status']})")
+    uncached = {}
+    attach_lifecycle_section(uncached, *args)
+    assert _lifecycle_feed_cached.cache_info().currsize == 0
+    assert _detect_lifecycle_cached.cache_info().currsize == 0
 
-    # Look for Jupiter Return
-    jupiter_return_found = False
-    for event in events['current_events']:
-        if event.get('planet') == 'Jupiter':
-            jupiter_return_found = True
-            print(f"\n✅ Jupiter Return detected with orb {event['orb']}°")
-            break
-
-    if jupiter_return_found:
-        print("\n✅ TEST 3 PASSED - Jupiter Return detected")
-    else:
-        print("\n⚠️  TEST 3: No Jupiter Return detected (may be due to orb timing)")
-
-    return events
+    cached = {}
+    attach_lifecycle_section(cached, *args, cached_charts=True)
+    assert _lifecycle_feed_cached.cache_info().currsize == 1
+    assert cached == uncached
 
 
-def test_past_events():
-    """
-    Test Case 4: Past Events Summary (Age 45)
-    Should show past milestones like Saturn Return, Chiron Opposition, etc.
-    """
-    print("\n" + "="*70)
-    print("TEST 4: Past Events Summary (Age 45)")
-    print("="*70)
-
-    natal_chart, transit_chart, natal_dt, transit_dt = create_charts(
-        "1979-01-15 12:00:00",
-        "2024-06-15 12:00:00"  # Age ~45.4
-    )
-
-    events = detect_lifecycle_events(
-        natal_chart, transit_chart, natal_dt, transit_dt
-    )
+def test_attached_lifecycle_data_is_not_shared(natal_chart_factory):
+    """Mutating one response's lifecycle data leaves the memo untouched."""
+    from immanuel_mcp.lifecycle.attach import attach_lifecycle_section
 
-    print(f"\nAge: {events['lifecycle_summary']['current_age']}")
-    print(f"Current Stage: {events['lifecycle_summary']['current_stage']['stage_name']}")
+    natal_chart, transit_chart, _, _ = create_charts(
+        natal_chart_factory, "1984-01-11 18:45:00", "2013-11-11 00:50:00")
+    args = (natal_chart, transit_chart, "1984-01-11 18:45:00", "2013-11-11 00:50:00")
 
-    if events['past_events']:
-        print(f"\nPast Milestones ({len(events['past_events'])} total):")
-        for event in events['past_events'][:5]:  # Show first 5
-            print(f"  • {event['name']} at age {event['typical_age']} "
-                  f"({event['years_ago']:.1f} years ago)")
+    first, second = {}, {}
+    attach_lifecycle_section(first, *args, cached_charts=True)
+    expected_events = list(first["lifecycle_events"])
+    first["lifecycle_events"].clear()
+    first["lifecycle_summary"]["mutated"] = True
 
-    assert len(events['past_events']) > 0, "Expected past events for age 45"
-    print("\n✅ TEST 4 PASSED")
-    return events
+    attach_lifecycle_section(second, *args, cached_charts=True)
+    assert second["lifecycle_events"] == expected_events
+    assert "mutated" not in second["lifecycle_summary"]
 
 
 def main():
-    """Run all tests."""
-    print("\n" + "="*70)
-    print("LIFECYCLE EVENTS DETECTION - TEST SUITE")
-    print("="*70)
-
-    try:
-        # Run all tests
-        test_saturn_return()
-        test_no_active_returns()
-        test_jupiter_return()
-        test_past_events()
-
-        print("\n" + "="*70)
-        print("✅ ALL TESTS COMPLETED SUCCESSFULLY")
-        print("="*70)
-
-        return 0
-
-    except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        return 1
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
+    """Legacy entry point for `python tests/test_lifecycle.py`: run under pytest."""
+    return pytest.main([__file__])
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    raise SystemExit(main())
@@ -14,235 +14,84 @@ the traditional astrological "orb" (aspect tolerance), but the angular distance
 remaining until the event occurs.
 """
 
-import sys
-import json
 from datetime import datetime
-from immanuel_mcp.lifecycle.lifecycle import detect_lifecycle_events
-from immanuel import charts
-from immanuel.setup import settings
-
-def test_lifecycle_fixes():
-    """Test all lifecycle event fixes."""
-    print("=" * 80)
-    print("LIFECYCLE EVENTS BUG FIXES TEST")
-    print("=" * 80)
-    print()
-
-    # Test case: Person born Jan 15, 1990, analyzed from Dec 22, 2024
-    birth_date = "1990-01-15 12:00:00"
-    analysis_date = "2024-12-22 12:00:00"
-    lat = 51.5074  # London
-    lon = -0.1278
-
-    print(f"Birth Date: {birth_date}")
-    print(f"Analysis Date: {analysis_date}")
-    print(f"Location: London ({lat}, {lon})")
-    print()
-
-    # Create charts
-    print("Creating charts...")
-    natal_subject = charts.Subject(
-        date_time=birth_date,
-        latitude=lat,
-        longitude=lon
-    )
-    natal_chart = charts.Natal(natal_subject)
 
-    transit_subject = charts.Subject(
-        date_time=analysis_date,
-        latitude=lat,
-        longitude=lon
-    )
-    transit_chart = charts.Natal(transit_subject)
+import pytest
+
+# Test case: Person born Jan 15, 1990, analyzed from Dec 22, 2024 (London).
+# The natal chart is the pickled cached_natal_1990 fixture.
+BIRTH_DATE = "1990-01-15 12:00:00"
+ANALYSIS_DATE = "2024-12-22 12:00:00"
+LAT = 51.5074
+LON = -0.1278
 
-    birth_dt = datetime.fromisoformat(birth_date)
-    transit_dt = datetime.fromisoformat(analysis_date)
 
-    print("[OK] Charts created")
-    print()
+@pytest.fixture(scope="module")
+def lifecycle_run(cached_natal_1990, natal_chart_factory):
+    """Lifecycle detection plus the formatted feed, computed once.
+
+    immanuel_mcp is imported here rather than at module top so collection
+    (and `-k` runs that deselect this module) don't pay for it.
+    """
+    from immanuel_mcp.lifecycle.lifecycle import detect_lifecycle_events, format_lifecycle_event_feed
+
+    transit_chart, transit_dt = natal_chart_factory(ANALYSIS_DATE, LAT, LON)
 
-    # Detect lifecycle events
-    print("Detecting lifecycle events...")
     lifecycle_data = detect_lifecycle_events(
-        natal_chart=natal_chart,
+        natal_chart=cached_natal_1990,
         transit_chart=transit_chart,
-        birth_datetime=birth_dt,
+        birth_datetime=datetime.fromisoformat(BIRTH_DATE),
         transit_datetime=transit_dt,
         include_future=True,
         future_years=20,
         max_future_events=10
     )
-    print("[OK] Lifecycle events detected")
-    print()
-
-    # Analyze results
-    current_events = lifecycle_data.get("current_events", [])
-    future_timeline = lifecycle_data.get("future_timeline", [])
-    lifecycle_summary = lifecycle_data.get("lifecycle_summary", {})
-
-    print(f"Current Events: {len(current_events)}")
-    print(f"Future Timeline Events: {len(future_timeline)}")
-    print()
-
-    # Test results
-    all_passed = True
-    test_results = []
-
-    print("=" * 80)
-    print("TEST RESULTS")
-    print("=" * 80)
-    print()
-
-    # TEST 1: Future dates should be in 2025+ (not 1990s)
-    print("TEST 1: Date Logic (Critical #2)")
-    print("-" * 40)
-    date_test_passed = True
-    for event in future_timeline:
-        predicted_date = event.get("predicted_date")
-        event_name = event.get("planet") or event.get("name", "Unknown")
-
-        if predicted_date:
-            year = int(predicted_date.split("-")[0])
-            if year < 2024:  # Should be in the future
-                print(f"  [FAIL] {event_name} has historical date: {predicted_date}")
-                date_test_passed = False
-            else:
-                print(f"  [PASS] {event_name} date: {predicted_date} (future)")
-
-    if date_test_passed:
-        print("  [OK] ALL DATES ARE IN THE FUTURE")
-    test_results.append(("Date Logic", date_test_passed))
-    all_passed = all_passed and date_test_passed
-    print()
-
-    # TEST 2: Angular separation values should be present for future events
-    print("TEST 2: Angular Separation Values (Critical #3)")
-    print("-" * 40)
-    orb_test_passed = True
-    events_with_orbs = 0
-    events_without_orbs = 0
-    skipped_nodes = 0
-
-    for event in future_timeline:
-        event_name = event.get("planet") or event.get("name", "Unknown")
-        current_angular_separation = event.get("current_angular_separation")
-        orb_status = event.get("orb_status")
-
-        if current_angular_separation is not None and orb_status is not None:
-            print(f"  [OK] PASS: {event_name} has angular separation: {current_angular_separation}° ({orb_status})")
-            events_with_orbs += 1
-        else:
-            # Node returns may not have orbs due to accessibility limitations
-            if "Node" in event_name:
-                print(f"  [WARN] SKIP: {event_name} missing angular separation (nodes not accessible in chart objects)")
-                skipped_nodes += 1
-            else:
-                print(f"  [FAIL] FAIL: {event_name} missing angular separation (current_angular_separation: {current_angular_separation}, orb_status: {orb_status})")
-                orb_test_passed = False
-                events_without_orbs += 1
-
-    if orb_test_passed:
-        print(f"  [OK] {events_with_orbs} EVENTS HAVE ANGULAR SEPARATION VALUES ({skipped_nodes} nodes skipped)")
-    else:
-        print(f"  [FAIL] {events_without_orbs} events missing angular separation values")
-    test_results.append(("Angular Separation Values", orb_test_passed))
-    all_passed = all_passed and orb_test_passed
-    print()
-
-    # TEST 3: Date ranges should be present
-    print("TEST 3: Date Ranges (High #4)")
-    print("-" * 40)
-    # Note: We need to check the formatted events, not raw timeline events
-    # Date ranges are added during formatting in format_lifecycle_event_feed
-    # For this test, we'll check if the formatting function exists and works
-    from immanuel_mcp.lifecycle.lifecycle import format_lifecycle_event_feed
-
-    formatted_payload = format_lifecycle_event_feed(
-        lifecycle_data,
-        transit_dt
-    )
-    formatted_events = formatted_payload.get("events", [])
-
-    date_range_test_passed = True
-    events_with_ranges = 0
-    events_without_ranges = 0
-
-    for event in formatted_events:
-        event_name = event.get("event_type", "Unknown")
-        date_range = event.get("date_range")
-
-        if date_range:
-            print(f"  [OK] PASS: {event_name} has date range: {date_range}")
-            events_with_ranges += 1
-        else:
-            # Date range might be None for some valid reasons (e.g., no orbital period)
-            # But most should have it
-            print(f"  [WARN] WARN: {event_name} missing date_range")
-            events_without_ranges += 1
-
-    # Pass if at least 50% have date ranges (some may legitimately not have them)
-    if events_with_ranges > 0:
-        print(f"  [OK] {events_with_ranges} events have date ranges")
-        date_range_test_passed = True
-    else:
-        print(f"  [FAIL] No events have date ranges")
-        date_range_test_passed = False
-
-    test_results.append(("Date Ranges", date_range_test_passed))
-    all_passed = all_passed and date_range_test_passed
-    print()
-
-    # TEST 4: Status field should be "upcoming" for future events
-    print("TEST 4: Status Field Logic (High #5)")
-    print("-" * 40)
-    status_test_passed = True
-
-    for event in formatted_events:
-        event_name = event.get("event_type", "Unknown")
-        status = event.get("status")
-        predicted_date = event.get("exact_date")
-
-        # All formatted events from future_timeline should have status="upcoming"
-        if status == "upcoming":
-            print(f"  [OK] PASS: {event_name} status: {status} (date: {predicted_date})")
-        else:
-            print(f"  [FAIL] FAIL: {event_name} has incorrect status: {status} (expected 'upcoming')")
-            status_test_passed = False
-
-    if status_test_passed:
-        print(f"  [OK] ALL {len(formatted_events)} EVENTS HAVE CORRECT STATUS")
-    test_results.append(("Status Field", status_test_passed))
-    all_passed = all_passed and status_test_passed
-    print()
-
-    # Summary
-    print("=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print()
-    for test_name, passed in test_results:
-        status = "[OK] PASS" if passed else "[FAIL] FAIL"
-        print(f"{status}: {test_name}")
-    print()
-
-    if all_passed:
-        print("=" * 80)
-        print("[OK] ALL TESTS PASSED!")
-        print("=" * 80)
-        return 0
-    else:
-        print("=" * 80)
-        print("[FAIL] SOME TESTS FAILED")
-        print("=" * 80)
-        return 1
-
-
-if __name__ == "__main__":
-    try:
-        exit_code = test_lifecycle_fixes()
-        sys.exit(exit_code)
-    except Exception as e:
-        print(f"\n[FAIL] TEST ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    formatted_events = format_lifecycle_event_feed(lifecycle_data, transit_dt).get("events", [])
+    return lifecycle_data.get("future_timeline", []), formatted_events
+
+
+def _event_name(event):
+    return event.get("planet") or event.get("name", "Unknown")
+
+
+def test_future_dates(lifecycle_run):
+    """Critical #2: future dates should be in 2024+ (not 1990s)."""
+    future_timeline, _ = lifecycle_run
+    historical = [
+        (_event_name(event), event["predicted_date"])
+        for event in future_timeline
+        if event.get("predicted_date") and int(event["predicted_date"][:4]) < 2024
+    ]
+    assert not historical, f"Events with historical dates: {historical}"
+
+
+def test_angular_separation_values(lifecycle_run):
+    """Critical #3: future events carry angular separation and orb status.
+
+    Node returns may lack them (nodes are not accessible in chart objects).
+    """
+    future_timeline, _ = lifecycle_run
+    missing = [
+        _event_name(event)
+        for event in future_timeline
+        if (event.get("current_angular_separation") is None or event.get("orb_status") is None)
+        and "Node" not in _event_name(event)
+    ]
+    assert not missing, f"Events missing angular separation: {missing}"
+
+
+def test_date_ranges(lifecycle_run):
+    """High #4: date ranges are added during formatting; most events have one."""
+    _, formatted_events = lifecycle_run
+    assert any(event.get("date_range") for event in formatted_events), "No events have date ranges"
+
+
+def test_status_field(lifecycle_run):
+    """High #5: every formatted future-timeline event is 'upcoming'."""
+    _, formatted_events = lifecycle_run
+    wrong = [
+        (event.get("event_type", "Unknown"), event.get("status"))
+        for event in formatted_events
+        if event.get("status") != "upcoming"
+    ]
+    assert not wrong, f"Events with incorrect status: {wrong}"
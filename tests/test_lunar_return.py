@@ -1,89 +1,69 @@
 #!/usr/bin/env python3
 """Test lunar return chart generation."""
 
-import sys
 import json
+import warnings
 
-print("Testing Lunar Return Chart Generation...")
-print()
-
-# Test importing the lunar return module
-try:
-    from immanuel_mcp.charts import lunar_return
-    print("[OK] Lunar return module imported successfully")
-except Exception as e:
-    print(f"[FAIL] Failed to import lunar return module: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
-
-# Test generating a lunar return chart
-try:
-    print("[TEST] Generating lunar return chart for January 2025...")
-    print("       Birth: 1990-01-15 14:30:00 at 32.71, -117.15")
-
-    result = lunar_return.generate_lunar_return_chart(
-        date_time="1990-01-15 14:30:00",
-        latitude="32.71",
-        longitude="-117.15",
-        return_year=2025,
-        return_month=1,
-        timezone="America/Los_Angeles"
-    )
+import pytest
 
-    if result.get('error'):
-        print(f"[FAIL] Chart generation returned error: {result.get('message')}")
-        sys.exit(1)
+BIRTH = dict(
+    date_time="1990-01-15 14:30:00",
+    latitude="32.71",
+    longitude="-117.15",
+    return_year=2025,
+    return_month=1,
+    timezone="America/Los_Angeles"
+)
 
-    # Check for lunar_return_info
-    if 'lunar_return_info' not in result:
-        print("[FAIL] Result missing lunar_return_info")
-        sys.exit(1)
 
-    info = result['lunar_return_info']
-    print(f"[OK] Lunar return chart generated!")
-    print(f"     Return date: {info['return_date']}")
-    print(f"     Natal Moon longitude: {info['natal_moon_longitude']:.2f} degrees")
-
-except Exception as e:
-    print(f"[FAIL] Error generating lunar return chart: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
-
-# Test generating compact lunar return chart
-try:
-    print()
-    print("[TEST] Generating compact lunar return chart...")
-
-    result = lunar_return.generate_compact_lunar_return_chart(
-        date_time="1990-01-15 14:30:00",
-        latitude="32.71",
-        longitude="-117.15",
-        return_year=2025,
-        return_month=1,
-        timezone="America/Los_Angeles"
-    )
+@pytest.fixture(scope="module")
+def lunar_return():
+    try:
+        from immanuel_mcp.charts import lunar_return
+    except Exception as e:
+        pytest.fail(f"Failed to import lunar return module: {e}")
+    return lunar_return
+
+
+def test_full_lunar_return(lunar_return):
+    result = lunar_return.generate_lunar_return_chart(**BIRTH)
 
     if result.get('error'):
-        print(f"[FAIL] Compact chart generation returned error: {result.get('message')}")
-        sys.exit(1)
+        pytest.fail(f"Chart generation returned error: {result.get('message')}")
+    assert 'lunar_return_info' in result, "Result missing lunar_return_info"
 
-    # Calculate response size
-    result_json = json.dumps(result)
-    size_kb = len(result_json) / 1024
+    info = result['lunar_return_info']
+    assert info['return_date']
+    assert 0 <= info['natal_moon_longitude'] < 360
 
-    print(f"[OK] Compact lunar return chart generated!")
-    print(f"     Response size: {size_kb:.2f} KB")
 
+def test_compact_lunar_return(lunar_return):
+    result = lunar_return.generate_compact_lunar_return_chart(**BIRTH)
+
+    if result.get('error'):
+        pytest.fail(f"Compact chart generation returned error: {result.get('message')}")
+
+    size_kb = len(json.dumps(result)) / 1024
     if size_kb > 50:
-        print(f"[WARN] Response size exceeds MCP limit (50 KB)")
+        warnings.warn(f"Compact lunar return is {size_kb:.2f} KB, above the 50 KB MCP limit")
 
-except Exception as e:
-    print(f"[FAIL] Error generating compact lunar return chart: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
 
-print()
-print("[SUCCESS] All lunar return tests passed!")
+def test_annual_lunar_returns_match_monthly_search(lunar_return):
+    result = lunar_return.generate_annual_lunar_returns(
+        BIRTH["date_time"], BIRTH["latitude"], BIRTH["longitude"],
+        BIRTH["return_year"], timezone=BIRTH["timezone"]
+    )
+
+    if result.get('error'):
+        pytest.fail(f"Annual lunar returns returned error: {result.get('message')}")
+    assert [entry['return_month'] for entry in result['lunar_returns']] == list(range(1, 13))
+
+    # The single sweep must agree with the per-month search to within the
+    # bisection tolerance.
+    lat, lon = float(BIRTH["latitude"]), float(BIRTH["longitude"])
+    batch = lunar_return._find_lunar_return_jds(
+        result['natal_moon_longitude'], BIRTH["return_year"], range(1, 13), lat, lon, BIRTH["timezone"])
+    for month, batch_jd in batch.items():
+        scalar_jd = lunar_return._find_lunar_return_jd(
+            result['natal_moon_longitude'], BIRTH["return_year"], month, lat, lon, BIRTH["timezone"])
+        assert abs(batch_jd - scalar_jd) < lunar_return._ONE_MINUTE_JD, f"Month {month} differs"
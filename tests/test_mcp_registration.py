@@ -1,67 +1,65 @@
 #!/usr/bin/env python3
 """Test if MCP server loads and registers tools correctly."""
 
-import sys
+import asyncio
 
-print("Testing MCP server module import and tool registration")
-print("=" * 60)
+import pytest
 
-try:
-    # Import the server module
-    print("\n[1] Importing immanuel_server module...")
-    import immanuel_server
-    print("[OK] Module imported successfully")
+# Tools defined in immanuel_server itself (exposed as module attributes)
+SERVER_TOOLS = (
+    'generate_natal_chart',
+    'generate_compact_natal_chart',
+    'get_chart_summary',
+    'get_planetary_positions',
+    'generate_solar_return_chart',
+    'generate_compact_solar_return_chart',
+    'generate_progressed_chart',
+    'generate_compact_progressed_chart',
+    'generate_composite_chart',
+    'generate_compact_composite_chart',
+    'generate_synastry_aspects',
+    'generate_compact_synastry_aspects',
+    'generate_transit_chart',
+    'generate_compact_transit_chart',
+    'generate_transit_to_natal',
+    'generate_compact_transit_to_natal',
+    'configure_immanuel_settings',
+    'list_available_settings',
+    'reset_immanuel_settings',
+)
 
-    # Check if mcp object exists
-    print("\n[2] Checking for MCP server object...")
-    if hasattr(immanuel_server, 'mcp'):
-        print("[OK] MCP server object found")
-        mcp = immanuel_server.mcp
-    else:
-        print("[FAIL] No 'mcp' attribute found in module")
-        sys.exit(1)
+# Tools registered from immanuel_mcp.charts.lunar_return on the shared instance
+LUNAR_RETURN_TOOLS = (
+    'generate_lunar_return_chart',
+    'generate_compact_lunar_return_chart',
+    'generate_annual_lunar_returns',
+)
 
-    # List registered tools
-    print("\n[3] Checking for specific tool functions...")
 
-    # Check if our specific tools are defined
-    if hasattr(immanuel_server, 'generate_transit_to_natal'):
-        print("[OK] generate_transit_to_natal function exists")
-        # Check if it's decorated
-        func = getattr(immanuel_server, 'generate_transit_to_natal')
-        print(f"     Function type: {type(func)}")
-        print(f"     Has __name__: {hasattr(func, '__name__')}")
-        if hasattr(func, '__name__'):
-            print(f"     Name: {func.__name__}")
-    else:
-        print("[FAIL] generate_transit_to_natal function NOT found")
+@pytest.fixture(scope="module")
+def server():
+    try:
+        import immanuel_server
+    except ImportError as e:
+        pytest.fail(f"Import error: {e}")
+    return immanuel_server
 
-    if hasattr(immanuel_server, 'generate_compact_transit_to_natal'):
-        print("[OK] generate_compact_transit_to_natal function exists")
-        # Check if it's decorated
-        func = getattr(immanuel_server, 'generate_compact_transit_to_natal')
-        print(f"     Function type: {type(func)}")
-    else:
-        print("[FAIL] generate_compact_transit_to_natal function NOT found")
 
-    # Check MCP internals
-    print("\n[4] Checking MCP server internals...")
-    if hasattr(mcp, '_tools'):
-        print(f"[OK] MCP has _tools attribute: {len(mcp._tools)} tools registered")
-        for tool_name in list(mcp._tools.keys())[:10]:  # Show first 10
-            print(f"     - {tool_name}")
-    elif hasattr(mcp, 'tools'):
-        print(f"[OK] MCP has tools attribute: {len(mcp.tools)} tools registered")
-    else:
-        print("[INFO] Cannot access internal tools registry")
+@pytest.fixture(scope="module")
+def registered_tools(server):
+    """Names of every tool on the MCP instance, listed once per module."""
+    return {t.name for t in asyncio.run(server.mcp.list_tools())}
 
-    print("\n[SUCCESS] All checks passed")
 
-except ImportError as e:
-    print(f"\n[FAIL] Import error: {e}")
-    import traceback
-    traceback.print_exc()
-except Exception as e:
-    print(f"\n[FAIL] Unexpected error: {type(e).__name__}: {e}")
-    import traceback
-    traceback.print_exc()
+def test_mcp_module_import(server):
+    assert hasattr(server, 'mcp'), "No 'mcp' attribute found in module"
+
+
+@pytest.mark.parametrize("name", SERVER_TOOLS)
+def test_tool_functions_exist(server, name):
+    assert callable(getattr(server, name, None)), f"{name} function NOT found"
+
+
+@pytest.mark.parametrize("name", SERVER_TOOLS + LUNAR_RETURN_TOOLS)
+def test_tool_registered(registered_tools, name):
+    assert name in registered_tools, f"{name} not registered on the MCP instance"
@@ -1,62 +1,34 @@
-from immanuel import charts
-
-s = charts.Subject('2000-01-01 12:00:00', 32.71, -117.15)
-n = charts.Natal(s)
-
-print("Testing natal chart attributes:")
-print()
-
-attrs_to_test = [
-    ('shape', 'natal.shape'),
-    ('moon_phase', 'natal.moon_phase'),
-    ('diurnal', 'natal.diurnal'),
-    ('house_system', 'natal.house_system'),
-]
-
-for attr_name, access_path in attrs_to_test:
-    try:
-        value = getattr(n, attr_name)
-        print(f"PASS {access_path}: {value}")
-        print(f"  Type: {type(value)}")
-
-        # If it's moon_phase, try to access .formatted
-        if attr_name == 'moon_phase':
-            if hasattr(value, 'formatted'):
-                print(f"  {access_path}.formatted: {value.formatted}")
-            else:
-                print(f"  FAIL NO 'formatted' attribute!")
-                print(f"  Available attributes: {[x for x in dir(value) if not x.startswith('_')]}")
-        print()
-    except AttributeError as e:
-        print(f"FAIL {access_path}: AttributeError - {e}")
-        print()
-    except Exception as e:
-        print(f"FAIL {access_path}: {type(e).__name__} - {e}")
-        print()
-
-# Now try the full get_chart_summary logic
-print("=" * 60)
-print("Testing full get_chart_summary logic:")
-print("=" * 60)
-
-try:
-    sun = n.objects.get(4000001)
-    moon = n.objects.get(4000002)
-    asc = n.objects.get(3000001)
+"""Check the natal chart attributes get_chart_summary relies on."""
+
+import pytest
+
+
+@pytest.mark.parametrize("attr_name", ['shape', 'moon_phase', 'diurnal', 'house_system'])
+def test_natal_attrs(cached_natal_1990, attr_name):
+    assert hasattr(cached_natal_1990, attr_name), f"natal.{attr_name} missing"
+
+
+def test_moon_phase_formatted(cached_natal_1990):
+    assert hasattr(cached_natal_1990.moon_phase, 'formatted'), (
+        f"natal.moon_phase has no 'formatted'; available: "
+        f"{[x for x in dir(cached_natal_1990.moon_phase) if not x.startswith('_')]}"
+    )
+
+
+def test_chart_summary_logic(cached_natal_1990):
+    """The full get_chart_summary extraction works on a real chart."""
+    sun = cached_natal_1990.objects.get(4000001)
+    moon = cached_natal_1990.objects.get(4000002)
+    asc = cached_natal_1990.objects.get(3000001)
 
     result = {
         "sun_sign": sun.sign.name if sun else "Unknown",
         "moon_sign": moon.sign.name if moon else "Unknown",
         "rising_sign": asc.sign.name if asc else "Unknown",
-        "chart_shape": n.shape,
-        "moon_phase": n.moon_phase.formatted,
-        "diurnal": n.diurnal,
-        "house_system": n.house_system
+        "chart_shape": cached_natal_1990.shape,
+        "moon_phase": cached_natal_1990.moon_phase.formatted,
+        "diurnal": cached_natal_1990.diurnal,
+        "house_system": cached_natal_1990.house_system
     }
 
-    print("PASS SUCCESS!")
-    print("Result:", result)
-except Exception as e:
-    print(f"FAIL FAILED: {type(e).__name__} - {e}")
-    import traceback
-    traceback.print_exc()
+    assert "Unknown" not in (result["sun_sign"], result["moon_sign"], result["rising_sign"])
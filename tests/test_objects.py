@@ -1,22 +1,14 @@
-from immanuel import charts
-from immanuel.const import chart as chart_const
+"""Check how natal.objects exposes chart objects."""
 
-s = charts.Subject('2000-01-01 12:00:00', 32.71, -117.15)
-n = charts.Natal(s)
 
-print("Type of n.objects:", type(n.objects))
-print("Has 'get' method:", hasattr(n.objects, 'get'))
-print("Has 'items' method:", hasattr(n.objects, 'items'))
-print()
+def test_objects_is_mapping(cached_natal_1990):
+    assert hasattr(cached_natal_1990.objects, 'get')
+    assert hasattr(cached_natal_1990.objects, 'items')
+    assert hasattr(cached_natal_1990.objects, 'keys')
 
-# Try to access Sun
-print("Trying to get Sun with chart_const.SUN:", chart_const.SUN)
-sun = n.objects.get(chart_const.SUN)
-print("Result:", sun)
-print()
 
-# List all available keys/attributes
-if hasattr(n.objects, 'keys'):
-    print("Keys in n.objects:", list(n.objects.keys())[:10])
-if hasattr(n.objects, '__dict__'):
-    print("Object attributes:", list(n.objects.__dict__.keys())[:10])
+def test_sun_lookup_by_constant(cached_natal_1990):
+    from immanuel.const import chart as chart_const
+
+    sun = cached_natal_1990.objects.get(chart_const.SUN)
+    assert sun is not None, f"No object for chart_const.SUN ({chart_const.SUN})"
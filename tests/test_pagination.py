@@ -13,7 +13,8 @@ Tests:
 """
 
 import sys
-import json
+
+from immanuel_mcp.utils.encoding import encoded_json_size
 from immanuel_server import generate_transit_to_natal
 
 # User's exact test case
@@ -56,8 +57,7 @@ else:
     print(f"[FAIL] Expected {aspect_summary.get('tight_aspects')} tight aspects, got {tight_count}")
 
 # Check response size
-json_str = json.dumps(result_tight)
-size_kb = len(json_str) / 1024
+size_kb = encoded_json_size(result_tight) / 1024
 print(f"Response size: {size_kb:.2f} KB")
 
 if size_kb < 50:
@@ -90,8 +90,7 @@ else:
     print(f"[FAIL] Expected {aspect_summary_mod.get('moderate_aspects')} moderate aspects, got {moderate_count}")
 
 # Check response size
-json_str_mod = json.dumps(result_moderate)
-size_kb_mod = len(json_str_mod) / 1024
+size_kb_mod = encoded_json_size(result_moderate) / 1024
 print(f"Response size: {size_kb_mod:.2f} KB")
 
 if size_kb_mod < 50:
@@ -124,8 +123,7 @@ else:
     print(f"[FAIL] Expected {aspect_summary_loose.get('loose_aspects')} loose aspects, got {loose_count}")
 
 # Check response size
-json_str_loose = json.dumps(result_loose)
-size_kb_loose = len(json_str_loose) / 1024
+size_kb_loose = encoded_json_size(result_loose) / 1024
 print(f"Response size: {size_kb_loose:.2f} KB")
 
 if size_kb_loose < 50:
@@ -159,8 +157,7 @@ else:
     print(f"[FAIL] Expected {expected_total} aspects, got {all_count}")
 
 # Check response size
-json_str_all = json.dumps(result_all)
-size_kb_all = len(json_str_all) / 1024
+size_kb_all = encoded_json_size(result_all) / 1024
 print(f"Response size: {size_kb_all:.2f} KB")
 
 if size_kb_all >= 50:
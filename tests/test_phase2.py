@@ -5,11 +5,7 @@ Comprehensive Phase 2 Testing
 - Test lifecycle events integration
 """
 
-import sys
-import json
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from immanuel_mcp.utils.encoding import encoded_json_size
 from immanuel_server import generate_compact_transit_to_natal, generate_transit_to_natal
 
 print("=" * 70)
@@ -66,8 +62,7 @@ try:
             print("\n  WARNING: No lifecycle events detected")
         
         # Check response size
-        json_str = json.dumps(result)
-        size_bytes = len(json_str.encode('utf-8'))
+        size_bytes = encoded_json_size(result)
         size_kb = size_bytes / 1024
         print(f"\n Response size: {size_bytes} bytes ({size_kb:.2f} KB)")
         
@@ -108,8 +103,7 @@ try:
             print("\n  WARNING: No lifecycle events in full version")
         
         # Check response size
-        json_str = json.dumps(result)
-        size_kb = len(json_str.encode('utf-8')) / 1024
+        size_kb = encoded_json_size(result) / 1024
         print(f"\n Response size: {size_kb:.2f} KB")
         
 except Exception as e:
@@ -5,6 +5,10 @@ from datetime import datetime
 from immanuel import charts
 from immanuel_mcp.lifecycle.lifecycle import detect_lifecycle_events, format_lifecycle_event_feed
 
+# Parsed once and passed through as datetime objects.
+BIRTH_DT = datetime.fromisoformat("1990-01-15 12:00:00")
+PROGRESSION_DT = datetime.fromisoformat("2025-01-15 12:00:00")
+
 print("=" * 80)
 print("TEST: Progressed Chart Lifecycle Events")
 print("=" * 80)
@@ -12,41 +16,37 @@ print("=" * 80)
 try:
     # Birth chart
     subject = charts.Subject(
-        date_time="1990-01-15 12:00:00",
+        date_time=BIRTH_DT,
         latitude=51.5074,
         longitude=-0.1278
     )
     natal_chart = charts.Natal(subject)
 
     # Progressed chart to 2025
-    progression_date = "2025-01-15 12:00:00"
-    progressed = charts.Progressed(subject, progression_date)
+    progressed = charts.Progressed(subject, PROGRESSION_DT)
 
     # Create transit chart for the progression date
     transit_subject = charts.Subject(
-        date_time=progression_date,
+        date_time=PROGRESSION_DT,
         latitude=51.5074,
         longitude=-0.1278
     )
     transit_chart = charts.Natal(transit_subject)
 
     # Detect lifecycle events
-    birth_dt = datetime.fromisoformat("1990-01-15 12:00:00")
-    progression_dt = datetime.fromisoformat(progression_date)
-
     lifecycle_data = detect_lifecycle_events(
         natal_chart=natal_chart,
         transit_chart=transit_chart,
-        birth_datetime=birth_dt,
-        transit_datetime=progression_dt,
+        birth_datetime=BIRTH_DT,
+        transit_datetime=PROGRESSION_DT,
         include_future=True,
         future_years=10,
         max_future_events=10
     )
 
-    payload = format_lifecycle_event_feed(lifecycle_data, progression_dt)
+    payload = format_lifecycle_event_feed(lifecycle_data, PROGRESSION_DT)
 
-    print(f"Progression Date: {progression_date}")
+    print(f"Progression Date: {PROGRESSION_DT}")
     print(f"Current Events: {len(lifecycle_data.get('current_events', []))}")
     print(f"Future Events: {len(lifecycle_data.get('future_timeline', []))}")
     print(f"Formatted Events: {len(payload.get('events', []))}")
@@ -1,10 +1,6 @@
 #!/usr/bin/env python3
 """Test progressed chart lifecycle events via MCP functions."""
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from immanuel_server import generate_compact_progressed_chart, generate_progressed_chart
 
 print("=" * 80)
@@ -4,7 +4,7 @@
 from datetime import datetime
 from immanuel import charts
 from immanuel_mcp.lifecycle.lifecycle import detect_lifecycle_events, format_lifecycle_event_feed
-from immanuel_server import parse_datetime_value
+from immanuel_server import parse_datetime_value, wall_clock_datetime
 
 print("=" * 80)
 print("TEST: Progressed Chart DateTime Extraction")
@@ -26,8 +26,8 @@ print(f"Raw object type: {type(progression_dt_obj)}")
 print(f"Raw object value: {progression_dt_obj}")
 
 if progression_dt_obj and hasattr(progression_dt_obj, 'datetime'):
-    progression_dt_value = progression_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[OK] Extracted datetime string: {progression_dt_value}")
+    progression_dt_value = wall_clock_datetime(progression_dt_obj.datetime)
+    print(f"[OK] Extracted datetime: {progression_dt_value}")
 else:
     progression_dt_value = str(progression_dt_obj)
     print(f"[WARN] Fallback to str: {progression_dt_value}")
@@ -5,6 +5,10 @@ import sys
 import json
 from datetime import datetime
 from immanuel import charts
+from immanuel_mcp.utils.datetimes import parse_datetime_value, wall_clock_datetime
+
+# Parsed once and passed through as a datetime object.
+BIRTH_DT = datetime.fromisoformat("1990-01-15 12:00:00")
 
 # Test 1: Solar Return with lifecycle events
 print("=" * 80)
@@ -13,7 +17,7 @@ print("=" * 80)
 
 try:
     subject = charts.Subject(
-        date_time="1990-01-15 12:00:00",
+        date_time=BIRTH_DT,
         latitude=51.5074,
         longitude=-0.1278
     )
@@ -24,7 +28,7 @@ try:
     # Get solar return datetime (handle wrapped DateTime object)
     solar_return_dt_obj = getattr(solar_return, 'solar_return_date_time', None)
     if solar_return_dt_obj and hasattr(solar_return_dt_obj, 'datetime'):
-        solar_return_dt = solar_return_dt_obj.datetime.strftime("%Y-%m-%d %H:%M:%S")
+        solar_return_dt = wall_clock_datetime(solar_return_dt_obj.datetime)
     elif solar_return_dt_obj:
         solar_return_dt = str(solar_return_dt_obj)
     else:
@@ -40,15 +44,13 @@ try:
 
     # Try to detect lifecycle events
     from immanuel_mcp.lifecycle.lifecycle import detect_lifecycle_events, format_lifecycle_event_feed
-    from datetime import datetime
 
-    birth_dt = datetime.fromisoformat("1990-01-15 12:00:00")
-    sr_dt = datetime.fromisoformat(solar_return_dt)
+    sr_dt = parse_datetime_value(solar_return_dt)
 
     lifecycle_data = detect_lifecycle_events(
         natal_chart=natal_chart,
         transit_chart=transit_chart,
-        birth_datetime=birth_dt,
+        birth_datetime=BIRTH_DT,
         transit_datetime=sr_dt,
         include_future=True,
         future_years=1,  # Only show events in the return year
@@ -1,34 +1,30 @@
 #!/usr/bin/env python3
 """Compare ToJSON vs CompactJSONSerializer output formats."""
 
-from immanuel import charts
 from immanuel.classes.serialize import ToJSON
+from immanuel_mcp.utils.chart_cache import get_transit_to_natal_charts
 from scripts.compact_serializer import CompactJSONSerializer
-import json
 
 
 def compare_serializers():
     """Compare the structure produced by ToJSON vs CompactJSONSerializer."""
     print("\n[COMPARISON] Comparing ToJSON vs CompactJSONSerializer...")
 
-    # Create test charts
-    natal_subject = charts.Subject(
-        date_time="1984-01-11 18:45:00",
-        latitude=40.7128,
-        longitude=-74.0060
-    )
-    transit_subject = charts.Subject(
-        date_time="2024-12-20 12:00:00",
-        latitude=40.7128,
-        longitude=-74.0060
+    # Test charts, shared with the self-aspect filtering tests through the
+    # server's chart cache (same key as generate_transit_to_natal uses)
+    natal_chart, transit_chart = get_transit_to_natal_charts(
+        ("1984-01-11 18:45:00", 40.7128, -74.0060),
+        ("2024-12-20 12:00:00", 40.7128, -74.0060),
+        None,
+        None
     )
 
-    natal_chart = charts.Natal(natal_subject)
-    transit_chart = charts.Natal(transit_subject, aspects_to=natal_chart)
+    # Only the top-level shape is compared, so each serializer's default()
+    # is called directly instead of encoding to a string and parsing it back.
 
     # Serialize with ToJSON
     print("\n[ToJSON Serializer]")
-    full_data = json.loads(json.dumps(transit_chart, cls=ToJSON))
+    full_data = ToJSON().default(transit_chart)
     print(f"  aspects type: {type(full_data.get('aspects'))}")
     if isinstance(full_data.get('aspects'), dict):
         print(f"  aspects keys (first 5): {list(full_data['aspects'].keys())[:5]}")
@@ -37,7 +33,7 @@ def compare_serializers():
 
     # Serialize with CompactJSONSerializer
     print("\n[CompactJSONSerializer]")
-    compact_data = json.loads(json.dumps(transit_chart, cls=CompactJSONSerializer))
+    compact_data = CompactJSONSerializer().default(transit_chart)
     print(f"  aspects type: {type(compact_data.get('aspects'))}")
     if isinstance(compact_data.get('aspects'), dict):
         print(f"  aspects keys (first 5): {list(compact_data['aspects'].keys())[:5]}")
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 """Test the fixed list_available_settings function"""
 
-import sys
 import json
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the function directly (without MCP server running)
 from immanuel import setup
@@ -1,8 +1,7 @@
-from immanuel import charts
 from immanuel.const import chart as chart_const
+from immanuel_mcp.utils.chart_cache import get_natal_chart
 
-s = charts.Subject('2000-01-01 12:00:00', 32.71, -117.15)
-n = charts.Natal(s)
+n = get_natal_chart('2000-01-01 12:00:00', 32.71, -117.15, None, None)
 
 # Get the objects
 sun = n.objects.get(chart_const.SUN)
@@ -2,6 +2,7 @@
 """Test to reproduce and verify fix for silent failure in full transit endpoint."""
 
 from immanuel_server import generate_transit_to_natal
+from immanuel_mcp.utils.encoding import encoded_json_size
 import json
 import sys
 
@@ -73,8 +74,7 @@ def test_full_transit_endpoint_handles_large_response():
     assert result.get("error") is not True, f"Endpoint returned error: {result.get('message')}"
 
     # Check response size
-    json_str = json.dumps(result)
-    size_kb = len(json_str) / 1024
+    size_kb = encoded_json_size(result) / 1024
     print(f"  [INFO] Response size: {size_kb:.2f} KB")
 
     # MCP should handle responses up to several MB, but warn if excessive
@@ -1,19 +1,56 @@
 #!/usr/bin/env python3
-"""Test that transit positions include all critical details."""
+"""
+Test that transit positions include all critical details.
+
+Diagnostics go to DEBUG logging; show them with:
+    uv run pytest tests/test_transit_position_details.py -o log_cli=true --log-cli-level=DEBUG
+"""
+
+import logging
+import os
+import sys
+
+import pytest
 
 from immanuel_server import generate_compact_transit_to_natal, generate_transit_to_natal
 
+PARAMS = {
+    "natal_date_time": "1984-01-11 18:45:00",
+    "natal_latitude": "40.7128",
+    "natal_longitude": "-74.0060",
+    "transit_date_time": "2024-12-20 12:00:00"
+}
 
-def test_compact_mode_has_retrograde_status():
-    """Verify ALL transit positions include retrograde status."""
-    result = generate_compact_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
-    )
+logger = logging.getLogger(__name__)
+
+ANGLES = ('Asc', 'MC')
+EXTENDED_FIELDS = ('declination', 'speed', 'out_of_bounds')
+INSPECT_TARGETS = frozenset(('Sun', 'Mercury', 'Venus'))
+
+
+def _extract_speed(obj_data):
+    """Daily speed of a position: 'speed', else daily_motion['raw'], else None."""
+    speed = obj_data.get('speed')
+    if speed is None and isinstance(obj_data.get('daily_motion'), dict):
+        speed = obj_data['daily_motion'].get('raw')
+    return speed
+
+
+@pytest.fixture(scope="module")
+def compact_result():
+    """Compact transit-to-natal response for PARAMS, computed once per module."""
+    return generate_compact_transit_to_natal(**PARAMS)
 
-    transit_positions = result.get("transit_positions", {})
+
+@pytest.fixture(scope="module")
+def full_result():
+    """Full transit-to-natal response for PARAMS, computed once per module."""
+    return generate_transit_to_natal(**PARAMS)
+
+
+def test_compact_mode_has_retrograde_status(compact_result):
+    """Verify ALL transit positions include retrograde status."""
+    transit_positions = compact_result.get("transit_positions", {})
 
     # Verify all positions have retrograde field
     for obj_key, obj_data in transit_positions.items():
@@ -22,221 +59,174 @@ def test_compact_mode_has_retrograde_status():
             f"{obj_data.get('name')} retrograde must be boolean"
 
         if obj_data['retrograde']:
-            print(f"  {obj_data['name']} is RETROGRADE")
+            logger.debug("%s is RETROGRADE", obj_data['name'])
 
-    print(f"✓ All {len(transit_positions)} positions have retrograde status")
+    logger.debug("All %d positions have retrograde status", len(transit_positions))
 
 
-def test_compact_mode_has_house_placement():
+def test_compact_mode_has_house_placement(compact_result):
     """Verify ALL transit positions include house number."""
-    result = generate_compact_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
-    )
+    transit_positions = compact_result.get("transit_positions", {})
 
-    transit_positions = result.get("transit_positions", {})
-
-    # Verify all positions have house field
+    # Verify all positions have house field, noting the houses occupied
     missing_house = []
+    houses = set()
     for obj_key, obj_data in transit_positions.items():
         if 'house' not in obj_data or obj_data['house'] is None:
             missing_house.append(obj_data.get('name'))
         else:
             house = obj_data['house']
             assert 1 <= house <= 12, f"{obj_data.get('name')} house {house} out of range"
+            houses.add(house)
 
     if missing_house:
-        print(f"  WARNING: {len(missing_house)} positions missing house: {missing_house}")
+        logger.warning("%d positions missing house: %s", len(missing_house), missing_house)
     else:
-        print(f"✓ All {len(transit_positions)} positions have valid house placement")
+        logger.debug("All %d positions have valid house placement", len(transit_positions))
 
     # Show house distribution
-    houses = [obj.get('house') for obj in transit_positions.values() if obj.get('house')]
-    print(f"  House distribution: {sorted(set(houses))}")
+    logger.debug("House distribution: %s", sorted(houses))
 
 
-def test_full_mode_has_extended_details():
+def test_full_mode_has_extended_details(full_result):
     """Verify full mode includes declination, OOB, and speed."""
-    result = generate_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
-    )
-
-    transit_positions = result.get("transit_positions", {})
+    transit_positions = full_result.get("transit_positions", {})
 
     # Check for extended details in full mode
-    has_declination = 0
-    has_speed = 0
-    has_oob = 0
+    positions = list(transit_positions.values())
+    has_declination = sum('declination' in obj_data for obj_data in positions)
+    has_speed = sum('speed' in obj_data or 'daily_motion' in obj_data for obj_data in positions)
+    has_oob = sum('out_of_bounds' in obj_data for obj_data in positions)
 
-    for obj_key, obj_data in transit_positions.items():
-        if 'declination' in obj_data:
-            has_declination += 1
-        if 'speed' in obj_data or 'daily_motion' in obj_data:
-            has_speed += 1
-        if 'out_of_bounds' in obj_data:
-            has_oob += 1
-
-    print(f"  Full mode extended details:")
-    print(f"    Declination: {has_declination}/{len(transit_positions)}")
-    print(f"    Speed/Motion: {has_speed}/{len(transit_positions)}")
-    print(f"    Out-of-Bounds: {has_oob}/{len(transit_positions)}")
+    logger.debug("Full mode extended details: declination %d/%d, speed/motion %d/%d, "
+                 "out-of-bounds %d/%d", has_declination, len(transit_positions),
+                 has_speed, len(transit_positions), has_oob, len(transit_positions))
 
     # Full mode should have at least some extended details
     # Note: Immanuel may not provide all these - adjust assertion as needed
-    print("✓ Full mode structure inspected")
+    logger.debug("Full mode structure inspected")
 
 
-def test_retrograde_speed_correlation():
+def test_retrograde_speed_correlation(full_result):
     """Verify retrograde status correlates with negative speed."""
-    result = generate_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
-    )
-
-    transit_positions = result.get("transit_positions", {})
+    transit_positions = full_result.get("transit_positions", {})
 
     # Check that retrograde planets have negative or very low speed
-    for obj_key, obj_data in transit_positions.items():
-        is_retrograde = obj_data.get('retrograde', False)
-        speed = obj_data.get('speed')
-        if speed is None and 'daily_motion' in obj_data:
-            motion = obj_data['daily_motion']
-            if isinstance(motion, dict):
-                speed = motion.get('raw')
-
-        if is_retrograde and speed is not None:
-            print(f"  {obj_data.get('name')}: retrograde={is_retrograde}, speed={speed}")
-
-            # Retrograde should correlate with negative speed (or close to zero at station)
-            if abs(speed) > 0.01:  # Not at stationary point
-                assert speed < 0, \
-                    f"{obj_data.get('name')} is retrograde but has positive speed {speed}"
-
-    print("✓ Retrograde status correlates with speed")
-
-
-def test_compact_mode_has_extended_details():
+    retrograde_speeds = {
+        obj_data.get('name', obj_key): _extract_speed(obj_data)
+        for obj_key, obj_data in transit_positions.items()
+        if obj_data.get('retrograde', False)
+    }
+    for name, speed in retrograde_speeds.items():
+        if speed is not None:
+            logger.debug("%s: retrograde=True, speed=%s", name, speed)
+
+    # Retrograde should correlate with negative speed (or close to zero at station)
+    moving_forward = [
+        f"{name} ({speed})" for name, speed in retrograde_speeds.items()
+        if speed is not None and speed > 0.01
+    ]
+    assert not moving_forward, f"Retrograde but positive speed: {moving_forward}"
+
+    logger.debug("Retrograde status correlates with speed")
+
+
+def test_compact_mode_has_extended_details(compact_result):
     """Verify compact mode includes declination, speed, and OOB status."""
-    result = generate_compact_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
-    )
+    transit_positions = compact_result.get("transit_positions", {})
 
-    transit_positions = result.get("transit_positions", {})
-
-    # Check for extended details in compact mode
-    has_declination = 0
-    has_speed = 0
-    has_oob = 0
+    # Check for extended details in compact mode, in one pass over the positions
+    missing = {field: [] for field in EXTENDED_FIELDS}
     planets_only = 0  # Count non-angle objects for OOB check
-    missing_details = []
-
-    for obj_key, obj_data in transit_positions.items():
+    for obj_data in transit_positions.values():
         obj_name = obj_data.get('name')
-        is_angle = obj_name in ['Asc', 'MC']
-        details = []
+        # OOB only applies to planets, not angles (Asc/MC)
+        is_angle = obj_name in ANGLES
+        planets_only += not is_angle
+        for field in EXTENDED_FIELDS:
+            if field not in obj_data and not (field == 'out_of_bounds' and is_angle):
+                missing[field].append(obj_name)
 
-        if 'declination' in obj_data:
-            has_declination += 1
-        else:
-            details.append('declination')
+    total = len(transit_positions)
+    has_declination = total - len(missing['declination'])
+    has_speed = total - len(missing['speed'])
+    has_oob = planets_only - len(missing['out_of_bounds'])
 
-        if 'speed' in obj_data:
-            has_speed += 1
-        else:
-            details.append('speed')
+    logger.debug("Compact mode extended details: declination %d/%d, speed %d/%d, "
+                 "out-of-bounds %d/%d (planets only)", has_declination, total,
+                 has_speed, total, has_oob, planets_only)
 
-        # OOB only applies to planets, not angles (Asc/MC)
-        if not is_angle:
-            planets_only += 1
-            if 'out_of_bounds' in obj_data:
-                has_oob += 1
-            else:
-                details.append('out_of_bounds')
-
-        if details:
-            missing_details.append(f"{obj_name}: {', '.join(details)}")
-
-    print(f"  Compact mode extended details:")
-    print(f"    Declination: {has_declination}/{len(transit_positions)}")
-    print(f"    Speed: {has_speed}/{len(transit_positions)}")
-    print(f"    Out-of-Bounds: {has_oob}/{planets_only} (planets only)")
-
-    if missing_details:
-        print(f"  Missing details (excluding expected OOB for angles):")
-        for detail in missing_details:
-            if 'out_of_bounds' not in detail or ('Asc' not in detail and 'MC' not in detail):
-                print(f"    {detail}")
+    for field, names in missing.items():
+        if names:
+            logger.debug("Missing %s: %s", field, names)
 
     # All positions should have declination and speed
-    assert has_declination == len(transit_positions), "Not all positions have declination"
-    assert has_speed == len(transit_positions), "Not all positions have speed"
+    assert not missing['declination'], f"Not all positions have declination: {missing['declination']}"
+    assert not missing['speed'], f"Not all positions have speed: {missing['speed']}"
     # Only planets should have OOB (not angles)
-    assert has_oob == planets_only, f"Not all planets have out_of_bounds ({has_oob}/{planets_only})"
+    assert not missing['out_of_bounds'], \
+        f"Not all planets have out_of_bounds ({has_oob}/{planets_only}): {missing['out_of_bounds']}"
 
-    print("✓ All positions have extended details in compact mode")
+    logger.debug("All positions have extended details in compact mode")
 
 
-def inspect_full_chart_structure():
-    """Temporary inspection to understand Immanuel's data structure."""
-    from immanuel_server import generate_transit_to_natal
+def inspect_full_chart_structure(full_result):
+    """Temporary inspection to understand Immanuel's data structure.
+
+    Only run from the script entry point, and only with IMMANUEL_INSPECT=1.
+    """
     import json
 
-    result = generate_transit_to_natal(
-        natal_date_time="1984-01-11 18:45:00",
-        natal_latitude="40.7128",
-        natal_longitude="-74.0060",
-        transit_date_time="2024-12-20 12:00:00"
+    # Print sample object structure: a planet with movement (like Sun or Mercury).
+    # Full-mode positions are keyed by name and carry no 'name' field.
+    transit_positions = full_result.get("transit_positions", {})
+    sample = next(
+        ((obj_data.get('name', obj_key), obj_data) for obj_key, obj_data in transit_positions.items()
+         if obj_data.get('name', obj_key) in INSPECT_TARGETS),
+        None
     )
-
-    # Print sample object structure
-    transit_positions = result.get("transit_positions", {})
-    if transit_positions:
-        # Get a planet with movement (like Sun or Mercury)
-        for obj_key, obj_data in transit_positions.items():
-            if obj_data.get('name') in ['Sun', 'Mercury', 'Venus']:
-                print(f"\n=== Sample object: {obj_data.get('name')} ===")
-                print("Available keys:", sorted(obj_data.keys()))
-                print("\nFull structure:")
-                print(json.dumps(obj_data, indent=2))
-                break
+    if sample:
+        name, obj_data = sample
+        print(f"\n=== Sample object: {name} ===")
+        print("Available keys:", sorted(obj_data.keys()))
+        print("\nFull structure:")
+        print(json.dumps(obj_data, indent=2))
 
 
 if __name__ == "__main__":
+    # Script mode: show the tests' diagnostics on stdout (not in the server log)
+    logger.addHandler(logging.StreamHandler(sys.stdout))
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
     print("Testing transit position details...")
+    compact = generate_compact_transit_to_natal(**PARAMS)
+    full = generate_transit_to_natal(**PARAMS)
 
-    # First, inspect the structure
-    print("\n" + "="*60)
-    print("STEP 1: Inspect Full Chart Structure")
-    print("="*60)
-    inspect_full_chart_structure()
+    # First, inspect the structure (opt-in: IMMANUEL_INSPECT=1)
+    if os.environ.get("IMMANUEL_INSPECT") == "1":
+        print("\n" + "="*60)
+        print("STEP 1: Inspect Full Chart Structure")
+        print("="*60)
+        inspect_full_chart_structure(full)
 
     print("\n" + "="*60)
     print("STEP 2: Run Tests")
     print("="*60)
     print("\n[Test 1/5] Retrograde status in compact mode...")
-    test_compact_mode_has_retrograde_status()
+    test_compact_mode_has_retrograde_status(compact)
 
     print("\n[Test 2/5] House placement in compact mode...")
-    test_compact_mode_has_house_placement()
+    test_compact_mode_has_house_placement(compact)
 
     print("\n[Test 3/5] Extended details in full mode...")
-    test_full_mode_has_extended_details()
+    test_full_mode_has_extended_details(full)
 
     print("\n[Test 4/5] Extended details in compact mode...")
-    test_compact_mode_has_extended_details()
+    test_compact_mode_has_extended_details(compact)
 
     print("\n[Test 5/5] Retrograde-speed correlation...")
-    test_retrograde_speed_correlation()
+    test_retrograde_speed_correlation(full)
 
     print("\n" + "="*60)
     print("✓ ALL TESTS PASSED - Transit position details complete!")